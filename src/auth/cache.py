@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+from redis.exceptions import RedisError
+
+from src.core.cache import TTLCache
+from src.core.config import (
+    REDIS_CLIENT,
+    AUTH_CACHE_TTL,
+    AUTH_CACHE_MAXSIZE,
+    AUTH_CACHE_REDIS,
+)
+from src.organization.models import Organization
+from src.user.models import User
+
+USER_KEY = "auth:user:{user_id}"
+USER_CHANNEL = "auth:user:invalidate"  # 메시지: user_id
+RESUBSCRIBE_DELAY = 1  # 초, Redis 연결 끊김 시 재구독 대기
+
+user_cache = TTLCache(maxsize=AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL)
+
+
+def dump_user(user: User) -> dict:
+    return {
+        "id": user.id,
+        "organization_id": user.organization_id,
+        "email": user.email,
+        "is_admin": user.is_admin,
+        "is_active": user.is_active,
+        "organization_name": user.organization.name if user.organization else None,
+    }
+
+
+def load_user(data: dict) -> User:
+    """캐시 데이터로 User 생성 (세션에 연결되지 않은 객체)"""
+
+    user = User(
+        id=data["id"],
+        organization_id=data["organization_id"],
+        email=data["email"],
+        is_admin=data["is_admin"],
+        is_active=data["is_active"],
+    )
+    if data["organization_name"] is not None:
+        user.organization = Organization(
+            id=data["organization_id"], name=data["organization_name"]
+        )
+    return user
+
+
+async def cache_get(cache: TTLCache, key: str):
+    """프로세스 캐시 -> Redis 캐시 순서로 조회, 없으면 None"""
+
+    value = cache.get(key)
+    if value is not None or not AUTH_CACHE_REDIS:
+        return value
+
+    try:
+        raw = await REDIS_CLIENT.get(key)
+    except RedisError as e:
+        print("[ERROR]", e)
+        return None
+
+    if raw is None:
+        return None
+
+    value = json.loads(raw)
+    cache.set(key, value)
+    return value
+
+
+async def cache_set(cache: TTLCache, key: str, value) -> None:
+    if AUTH_CACHE_TTL <= 0:
+        return
+
+    cache.set(key, value)
+    if AUTH_CACHE_REDIS:
+        try:
+            await REDIS_CLIENT.set(key, json.dumps(value), ex=AUTH_CACHE_TTL)
+        except RedisError as e:
+            print("[ERROR]", e)
+
+
+async def cache_delete(cache: TTLCache, key: str) -> None:
+    cache.delete(key)
+    if AUTH_CACHE_REDIS:
+        try:
+            await REDIS_CLIENT.delete(key)
+        except RedisError as e:
+            print("[ERROR]", e)
+
+
+async def get_user(user_id: int) -> User | None:
+    data = await cache_get(user_cache, USER_KEY.format(user_id=user_id))
+    return load_user(data) if data else None
+
+
+async def set_user(user: User) -> None:
+    await cache_set(user_cache, USER_KEY.format(user_id=user.id), dump_user(user))
+
+
+async def invalidate_user(user_id: int) -> None:
+    """유저 정보 변경 시 호출 (권한 변경, 탈퇴 등) - 모든 API 서버의 캐시 무효화"""
+
+    await cache_delete(user_cache, USER_KEY.format(user_id=user_id))
+    try:
+        await REDIS_CLIENT.publish(USER_CHANNEL, user_id)
+    except RedisError as e:
+        print("[ERROR]", e)
+
+
+async def listen_user_invalidation() -> None:
+    """
+    유저 캐시 무효화 메시지 구독 (API 서버 시작 시 백그라운드 실행)
+    - 연결이 끊기면 그동안의 메시지를 놓쳤을 수 있으므로 캐시 전체 삭제 후 재구독
+    """
+
+    while True:
+        pubsub = REDIS_CLIENT.pubsub()
+        try:
+            await pubsub.subscribe(USER_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message" and message["data"].isdigit():
+                    user_cache.delete(USER_KEY.format(user_id=message["data"]))
+        except RedisError as e:
+            print("[ERROR]", e)
+        finally:
+            await pubsub.aclose()
+
+        user_cache.clear()
+        await asyncio.sleep(RESUBSCRIBE_DELAY)
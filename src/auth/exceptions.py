@@ -1,6 +1,13 @@
-from src.core.exceptions import UnauthorizedException
+from src.core.exceptions import UnauthorizedException, ServiceUnavailableException
 
 
 class InvalidCredentials(UnauthorizedException):
     def __init__(self):
         super().__init__("이메일 또는 비밀번호가 올바르지 않습니다.")
+
+
+class PasswordHashBusy(ServiceUnavailableException):
+    def __init__(self):
+        super().__init__(
+            "요청이 많아 비밀번호를 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+        )
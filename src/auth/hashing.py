@@ -0,0 +1,101 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from passlib.context import CryptContext
+
+from src.core import metrics
+from src.core.config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_WAITING
+from src.auth.exceptions import PasswordHashBusy
+
+T = TypeVar("T")
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt는 GIL을 해제하므로 스레드로 병렬 처리 가능
+executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+slots = asyncio.Semaphore(PASSWORD_HASH_WORKERS)
+
+waiting = metrics.gauge("password_hash_waiting", "비밀번호 해시 실행 대기 수")
+running = metrics.gauge("password_hash_running", "비밀번호 해시 실행 중 수")
+rejected = metrics.counter(
+    "password_hash_rejected_total", "대기 상한 초과로 거절된 요청 수"
+)
+wait_seconds = metrics.histogram(
+    "password_hash_wait_seconds", "비밀번호 해시 실행 대기 시간"
+)
+run_seconds = metrics.histogram("password_hash_seconds", "비밀번호 해시 실행 시간")
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+async def run_in_hash_pool(func: Callable[..., T], *args) -> T:
+    """
+    비밀번호 해시 전용 스레드 풀에서 실행
+
+    - 동시 실행은 PASSWORD_HASH_WORKERS 개로 제한, 나머지는 대기
+    - 대기 요청이 PASSWORD_HASH_MAX_WAITING 이상이면 PasswordHashBusy (503)
+    """
+
+    if PASSWORD_HASH_MAX_WAITING and waiting.value >= PASSWORD_HASH_MAX_WAITING:
+        rejected.inc()
+        raise PasswordHashBusy
+
+    queued_at = time.perf_counter()
+    waiting.inc()
+    try:
+        await slots.acquire()
+    finally:
+        waiting.dec()
+
+    started_at = time.perf_counter()
+    wait_seconds.observe(started_at - queued_at)
+    running.inc()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
+    finally:
+        running.dec()
+        run_seconds.observe(time.perf_counter() - started_at)
+        slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    return await run_in_hash_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """여러 비밀번호 병렬 해시 (celery 작업용)"""
+    return list(executor.map(hash_password, passwords))
+
+
+async def hash_passwords_async(passwords: list[str], chunk_size: int = 16) -> list[str]:
+    """
+    여러 비밀번호 병렬 해시 (일괄 등록용)
+    - chunk 단위로 나눠 실행, 풀의 절반까지만 사용하여 로그인 요청 처리 여유 확보
+    """
+
+    limit = asyncio.Semaphore(max(1, PASSWORD_HASH_WORKERS // 2))
+
+    async def hash_chunk(chunk: list[str]) -> list[str]:
+        async with limit:
+            return await run_in_hash_pool(lambda: [hash_password(p) for p in chunk])
+
+    chunks = [
+        passwords[i : i + chunk_size] for i in range(0, len(passwords), chunk_size)
+    ]
+    results = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+    return [hashed for result in results for hashed in result]
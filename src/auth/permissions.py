@@ -1,11 +1,15 @@
+import hmac
 from typing import Annotated, Callable
-from fastapi import HTTPException, status, Depends
+from fastapi import Header, HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_db
-from src.auth.token import verify_access_token
-from src.organization.repository import is_paid_plan
+from src.db.routing import primary_reads
+from src.auth import cache as auth_cache
+from src.core.config import OPERATOR_TOKEN
+from src.auth.token import CREDENTIALS_EXCEPTION, verify_access_token
+from src.organization.entitlements import get_entitlement
 from src.user.models import User
 from src.user.repository import get_user
 
@@ -15,11 +19,27 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession = Depends(get_db)
 ) -> User:
+    """
+    로그인 유저 조회
+
+    - 같은 요청 안에서는 FastAPI 의존성 캐시로 한 번만 실행
+    - 유저 정보는 AUTH_CACHE_TTL 동안 캐시 (변경 시 무효화)
+    - 유료 플랜 여부는 기업 플랜 권한 캐시로 판별
+    """
+
     user_id = verify_access_token(token)
-    user = await get_user(db, user_id)
+
+    user = await auth_cache.get_user(user_id)
+    if user is None:
+        with primary_reads(db):
+            user = await get_user(db, user_id)
+        if user is None:
+            raise CREDENTIALS_EXCEPTION
+        await auth_cache.set_user(user)
 
     # 소속 기업의 유료 플랜 이용 여부 확인
-    user.is_paid = await is_paid_plan(db, user.organization_id)
+    entitlement = await get_entitlement(db, user.organization_id)
+    user.is_paid = entitlement.is_paid
     return user
 
 
@@ -47,3 +67,24 @@ paid_admin_required = RequireRole(
     check=lambda user: user.is_admin and user.is_paid,
     error_message="결제가 필요한 서비스 입니다.",
 )
+
+
+async def operator_required(
+    x_operator_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """
+    운영자 권한 확인
+
+    - 서버 지표 등 전체 기업에 걸친 정보는 기업 관리자가 아닌 운영자만 조회
+    - X-Operator-Token 헤더를 OPERATOR_TOKEN과 비교 (미설정 시 항상 거부)
+    """
+
+    if not (
+        OPERATOR_TOKEN
+        and x_operator_token
+        and hmac.compare_digest(x_operator_token, OPERATOR_TOKEN)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="운영자 권한이 필요합니다.",
+        )
@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """
+    프로세스 내 LRU + TTL 캐시
+
+    - maxsize 초과 시 가장 오래 사용하지 않은 항목 제거
+    - 항목마다 만료 시각 지정 가능 (기본 ttl 초)
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key, default=None):
+        item = self.data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self.data[key]
+            return default
+
+        self.data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            self.data.pop(key, None)
+            return
+
+        self.data[key] = (time.monotonic() + ttl, value)
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        self.data.pop(key, None)
+
+    def clear(self) -> None:
+        self.data.clear()
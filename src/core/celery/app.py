@@ -8,6 +8,7 @@ celery_app = Celery(
     backend=f"redis://{REDIS_HOST_1}:{REDIS_PORT}/0",
     include=[
         "src.core.celery.tasks.organization",
+        "src.core.celery.tasks.user",
         "src.core.celery.tasks.video",
     ],
 )
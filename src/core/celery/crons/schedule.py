@@ -1,8 +1,28 @@
 from celery.schedules import crontab
 
+from src.core.config import POINT_FLUSH_INTERVAL, SUBSCRIPTION_EXPIRY_POLL_INTERVAL
+
 beat_schedule = {
+    "expire-due-subscriptions": {
+        "task": "expire_due_subscriptions",
+        "schedule": SUBSCRIPTION_EXPIRY_POLL_INTERVAL,  # 초, 만료 시각이 지난 예약 처리
+    },
     "expire-paid-subscriptions-daily": {
         "task": "expire_paid_subscriptions",
-        "schedule": crontab(minute=0, hour=9),  # UTC 기준 매일 자정 실행
-    }
+        "schedule": crontab(
+            minute=0, hour=9
+        ),  # UTC 기준 매일 자정 실행, 예약 누락분 보정
+    },
+    "cleanup-stale-temp-files-hourly": {
+        "task": "cleanup_stale_temp_files",
+        "schedule": crontab(minute=30),  # 매 시간 30분 실행
+    },
+    "collect-unreferenced-blobs-daily": {
+        "task": "collect_unreferenced_blobs",
+        "schedule": crontab(minute=0, hour=18),
+    },
+    "flush-buffered-points": {
+        "task": "flush_buffered_points",
+        "schedule": POINT_FLUSH_INTERVAL,  # 초, POINT_ACCRUAL_MODE=buffered 적재분 저장
+    },
 }
@@ -1,63 +1,260 @@
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from celery import shared_task
-from sqlalchemy import select, update, and_
+from redis.exceptions import RedisError
+from sqlalchemy import select, update, insert, exists, literal
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
 
+from src.core.config import (
+    SUBSCRIPTION_EXPIRE_BATCH_SIZE,
+    SUBSCRIPTION_EXPIRY_POLL_INTERVAL,
+)
 from src.db.sync_session import sync_session
-from src.organization.models import OrganizationSubscription, OrganizationPlan
+from src.core.locks import acquire_lock_sync, release_lock_sync
+from src.organization.entitlements import invalidate_entitlements_sync
+from src.organization.expiry import (
+    EXPIRY_LOCK_KEY,
+    get_due_expiries_sync,
+    remove_expiries_sync,
+    schedule_expiries_sync,
+)
+from src.organization.models import (
+    Organization,
+    OrganizationSubscription,
+    OrganizationPlan,
+)
+from src.organization.schemas import PlanType
 
+# 일일 만료 작업에서 만료 예약을 다시 등록하는 범위 (Redis 유실 대비)
+RESCHEDULE_AHEAD = timedelta(days=2)
 
-@shared_task(name="expire_paid_subscriptions")
-def expire_paid_subscriptions():
-    """만료 유료 플랜 비활성화 작업"""
 
+def get_trial_plan_id() -> int:
     with sync_session() as db:
-        now = datetime.now()
-        try:
-            with db.begin():
-                # 1. 만료 대상 유료 구독 조회
-                paid_subscription_stmt = (
-                    select(OrganizationSubscription.organization_id)
-                    .join(OrganizationSubscription.plan)
-                    .where(
-                        and_(
-                            OrganizationSubscription.is_active.is_(True),
-                            OrganizationSubscription.end_date <= now,
-                            OrganizationPlan.price > 0,
-                        )
-                    )
-                )
-                query = db.execute(paid_subscription_stmt)
-                expired_org_ids = [row.organization_id for row in query.fetchall()]
-
-                # 2. 유료 구독 만료
-                stmt = (
-                    update(OrganizationSubscription)
-                    .where(
-                        and_(
-                            OrganizationSubscription.is_active.is_(True),
-                            OrganizationSubscription.end_date <= datetime.now(),
-                        )
-                    )
-                    .values(is_active=False, end_date=now)
-                )
-                db.execute(stmt)
-
-                # 2. 무료 구독 추가 -> 커밋
-                plan_id = db.query(OrganizationPlan).filter(name="TRIAL").first().id
-                subscriptions = [
-                    OrganizationSubscription(
-                        organization_id=org_id,
-                        plan_id=plan_id,
-                    )
-                    for org_id in expired_org_ids
-                ]
-                db.add_all(subscriptions)
-                db.commit()
-
-                print(
-                    f"[INFO] {len(expired_org_ids)}개 조직이 무료 플랜으로 전환 되었습니다."
+        return db.execute(
+            select(OrganizationPlan.id).where(
+                OrganizationPlan.name == PlanType.TRIAL.value
+            )
+        ).scalar_one()
+
+
+def make_expire_stmt(
+    now: datetime, batch_size: int, subscription_ids: list[int] | None = None
+):
+    """
+    만료된 유료 구독 batch_size건 비활성화 쿼리 (UPDATE ... RETURNING id, organization_id)
+    - ix_organization_subscriptions_active_end_date 인덱스 사용 (end_date 순)
+    """
+
+    expired = (
+        select(OrganizationSubscription.id)
+        .join(OrganizationSubscription.plan)
+        .where(
+            OrganizationSubscription.is_active == True,
+            OrganizationSubscription.end_date <= now,
+            OrganizationPlan.price > 0,
+        )
+        .order_by(OrganizationSubscription.end_date)
+        .limit(batch_size)
+        .with_for_update(of=OrganizationSubscription, skip_locked=True)
+    )
+    if subscription_ids is not None:
+        expired = expired.where(OrganizationSubscription.id.in_(subscription_ids))
+    expired = expired.cte("expired")
+
+    return (
+        update(OrganizationSubscription)
+        .where(OrganizationSubscription.id == expired.c.id)
+        .values(is_active=False, end_date=now)
+        .returning(
+            OrganizationSubscription.id, OrganizationSubscription.organization_id
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def expire_subscription_batch(
+    now: datetime,
+    trial_plan_id: int,
+    batch_size: int,
+    subscription_ids: list[int] | None = None,
+) -> tuple[list[int], list[int], int]:
+    """
+    만료된 유료 구독 batch_size건 비활성화 + 무료 구독 생성 (chunk마다 한 트랜잭션)
+
+    - UPDATE ... RETURNING으로 만료 처리한 기업만 INSERT ... SELECT로 무료 구독 생성
+    - 다른 작업(유료 전환 등)이 잠근 구독은 건너뜀 (SKIP LOCKED), 다음 실행에서 처리
+    - 활성 구독이 이미 있는 기업은 무료 구독 생성 안함 (재실행 시 중복 방지)
+    - subscription_ids: 지정한 구독 중에서만 처리 (만료 예약 처리용)
+    :return: (만료 처리한 구독 ID 목록, 기업 ID 목록, 생성한 무료 구독 수)
+    """
+
+    expire_stmt = make_expire_stmt(now, batch_size, subscription_ids)
+    active = aliased(OrganizationSubscription)
+    with sync_session() as db, db.begin():
+        rows = db.execute(expire_stmt).all()
+        if not rows:
+            return [], [], 0
+        expired_ids = [row.id for row in rows]
+        org_ids = [row.organization_id for row in rows]
+
+        trial_stmt = (
+            insert(OrganizationSubscription)
+            .from_select(
+                ["organization_id", "plan_id"],
+                select(Organization.id, literal(trial_plan_id)).where(
+                    Organization.id.in_(org_ids),
+                    ~exists().where(
+                        active.organization_id == Organization.id,
+                        active.is_active == True,
+                    ),
+                ),
+            )
+            .returning(OrganizationSubscription.id)
+        )
+        created = len(db.execute(trial_stmt).all())
+
+    return expired_ids, org_ids, created
+
+
+def get_pending_subscription_ids(
+    now: datetime, subscription_ids: list[int]
+) -> set[int]:
+    """지정한 구독 중 아직 만료 처리 대상인 구독 ID (활성 유료 구독, 만료 시각 지남)"""
+
+    with sync_session() as db:
+        return set(
+            db.execute(
+                select(OrganizationSubscription.id)
+                .join(OrganizationSubscription.plan)
+                .where(
+                    OrganizationSubscription.id.in_(subscription_ids),
+                    OrganizationSubscription.is_active == True,
+                    OrganizationSubscription.end_date <= now,
+                    OrganizationPlan.price > 0,
                 )
+            ).scalars()
+        )
+
+
+@shared_task(name="expire_paid_subscriptions")
+def expire_paid_subscriptions(batch_size: int = SUBSCRIPTION_EXPIRE_BATCH_SIZE):
+    """
+    만료 유료 플랜 비활성화 작업 (일일 보정 작업)
+
+    - 구독별 만료는 expire_due_subscriptions에서 처리, 예약 누락 / 실패분을 여기서 처리
+    - batch_size건씩 나눠 커밋하여 구독 테이블 잠금 시간 최소화
+    - 중간에 실패해도 커밋된 chunk는 유지, 다시 실행하면 남은 구독부터 처리
+    - RESCHEDULE_AHEAD 안에 만료되는 유료 구독은 만료 예약 다시 등록
+    :return dict: 만료 구독 수, 생성한 무료 구독 수, chunk 수, 소요 시간(초)
+    """
+
+    started_at = time.perf_counter()
+    now = datetime.now()  # 실행 중 만료되는 구독은 다음 실행에서 처리
+    report = {"expired": 0, "trial_created": 0, "batches": 0}
+
+    try:
+        trial_plan_id = get_trial_plan_id()
+        while True:
+            _, org_ids, created = expire_subscription_batch(
+                now, trial_plan_id, batch_size
+            )
+            if org_ids:
+                report["batches"] += 1
+                report["expired"] += len(org_ids)
+                report["trial_created"] += created
+                invalidate_entitlements_sync(org_ids)
+
+            if len(org_ids) < batch_size:
+                break
+
+        reschedule_upcoming_expiries(now)
+
+    except (SQLAlchemyError, RedisError) as e:
+        print("[ERROR] expire_paid_subscriptions >>> ", e)
+
+    report["seconds"] = round(time.perf_counter() - started_at, 3)
+    print(
+        f"[INFO] 유료 구독 {report['expired']}건 만료, "
+        f"무료 플랜 전환 {report['trial_created']}건 "
+        f"({report['batches']} batch, {report['seconds']}s)"
+    )
+    return report
+
+
+def reschedule_upcoming_expiries(now: datetime) -> None:
+    """곧 만료되는 유료 구독 만료 예약 (배포 이전 구독, Redis 데이터 유실 대비)"""
+
+    with sync_session() as db:
+        subscriptions = db.execute(
+            select(OrganizationSubscription.id, OrganizationSubscription.end_date)
+            .join(OrganizationSubscription.plan)
+            .where(
+                OrganizationSubscription.is_active == True,
+                OrganizationSubscription.end_date <= now + RESCHEDULE_AHEAD,
+                OrganizationPlan.price > 0,
+            )
+        ).all()
+
+    schedule_expiries_sync([tuple(row) for row in subscriptions])
+
+
+@shared_task(name="expire_due_subscriptions")
+def expire_due_subscriptions(batch_size: int = SUBSCRIPTION_EXPIRE_BATCH_SIZE):
+    """
+    만료 예약된 구독 중 만료 시각이 지난 구독 처리 (SUBSCRIPTION_EXPIRY_POLL_INTERVAL 주기)
+
+    - 유료 전환 시 구독 ID를 만료 시각과 함께 Redis sorted set에 예약
+    - DB 커밋 후 만료 처리한 구독의 예약 삭제, 실패 시 다음 실행에서 재시도
+    - 이미 만료 / 해지 / 연장된 구독은 건너뛰고 예약만 삭제
+    - 다른 작업이 잠근 구독(SKIP LOCKED)은 예약을 남겨 다음 실행에서 처리
+    - 동시에 하나의 작업만 실행 (Redis 락)
+    """
+
+    lock_timeout = max(SUBSCRIPTION_EXPIRY_POLL_INTERVAL * 5, 60)
+    lock_token = acquire_lock_sync(EXPIRY_LOCK_KEY, lock_timeout)
+    if lock_token is None:
+        return
+
+    now = datetime.now()
+    expired = 0
+    skipped = 0  # 잠겨서 남겨둔 예약 수 (다음 조회에서 건너뜀)
+    try:
+        trial_plan_id = None
+        while True:
+            subscription_ids = get_due_expiries_sync(now, batch_size, offset=skipped)
+            if not subscription_ids:
+                break
+
+            trial_plan_id = trial_plan_id or get_trial_plan_id()
+            expired_ids, org_ids, _ = expire_subscription_batch(
+                now, trial_plan_id, batch_size, subscription_ids=subscription_ids
+            )
+            remaining_ids = set(subscription_ids) - set(expired_ids)
+            locked_ids = (
+                get_pending_subscription_ids(now, list(remaining_ids))
+                if remaining_ids
+                else set()
+            )
+            remove_expiries_sync(
+                [sub_id for sub_id in subscription_ids if sub_id not in locked_ids]
+            )
+            invalidate_entitlements_sync(org_ids)
+            expired += len(org_ids)
+            skipped += len(locked_ids)
+
+            if len(subscription_ids) < batch_size:
+                break
+
+    except (SQLAlchemyError, RedisError) as e:
+        print("[ERROR] expire_due_subscriptions >>> ", e)
+
+    finally:
+        if not release_lock_sync(EXPIRY_LOCK_KEY, lock_token):
+            print(
+                "[ERROR] expire_due_subscriptions 실행 중 락 만료 (다른 작업과 동시 실행 가능)"
+            )
 
-        except SQLAlchemyError as e:
-            print("[ERROR] expire_paid_subscriptions >>> ", e)
+    if expired:
+        print(f"[INFO] 예약된 유료 구독 {expired}건 만료")
@@ -0,0 +1,276 @@
+import json
+import os
+from datetime import datetime
+from collections import Counter
+
+from redis.exceptions import RedisError
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.config import (
+    SYNC_REDIS_CLIENT,
+    POINT_FLUSH_INTERVAL,
+    POINT_FLUSH_BATCH_SIZE,
+)
+from src.db.sync_session import sync_session
+from src.core.locks import acquire_lock_sync, release_lock_sync
+from src.core.celery.app import celery_app
+from src.core.exceptions import AppBaseException
+from src.auth.hashing import hash_passwords
+from src.user.models import User, UserVideoPoint
+from src.user.imports import UserImporter, make_import_rows, update_import_job_sync
+from src.user.points import (
+    FLUSH_LOCK_KEY,
+    LEADERBOARD_KEY,
+    claim_point_batch_sync,
+    finish_point_batch_sync,
+    get_point_batch_sync,
+    get_point_bucket,
+    get_stale_point_batches_sync,
+    invalidate_leaderboards_sync,
+)
+from src.organization.models import Organization
+from src.user.repository import (
+    make_point_balance_recompute,
+    make_point_balance_upsert,
+    make_user_bulk_insert,
+)
+
+
+def save_point_entries(entries: list[str]) -> None:
+    """
+    포인트 적립 내역을 DB에 일괄 저장
+
+    - 시간 구간(bucket) unique key로 재시도 시 중복 저장 방지
+    - 실제 저장된 포인트만 유저 포인트 합계 / 순위표에 반영
+    """
+
+    rows = []
+    for entry in entries:
+        try:
+            data = json.loads(entry)
+            created_at = datetime.fromisoformat(data["created_at"])
+            rows.append(
+                {
+                    "user_id": int(data["user_id"]),
+                    "video_id": int(data["video_id"]),
+                    "bucket": get_point_bucket(created_at),
+                    "created_at": created_at,
+                }
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            print("[ERROR] 잘못된 포인트 적립 데이터:", entry, e)
+
+    balances = []
+    with sync_session() as db:
+        try:
+            if rows:
+                inserted = db.execute(
+                    insert(UserVideoPoint)
+                    .on_conflict_do_nothing(constraint="unique_user_video_point_bucket")
+                    .returning(UserVideoPoint.user_id, UserVideoPoint.point),
+                    rows,
+                ).all()
+
+                points = Counter()
+                for user_id, point in inserted:
+                    points[user_id] += point
+                for user_id, point in points.items():
+                    result = db.execute(make_point_balance_upsert(user_id, point))
+                    balance = result.one_or_none()
+                    if balance:
+                        balances.append((user_id, *balance))
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+
+    if balances:
+        with SYNC_REDIS_CLIENT.pipeline(transaction=False) as pipe:
+            for user_id, organization_id, balance in balances:
+                key = LEADERBOARD_KEY.format(organization_id=organization_id)
+                pipe.zadd(key, {str(user_id): balance}, gt=True)
+            pipe.execute()
+
+
+def flush_point_batch(batch_size: int) -> int:
+    """
+    큐 앞쪽 batch_size건을 가져가서 DB에 일괄 저장
+
+    - 가져간 내역은 batch 전용 list에 보관, DB 커밋 후 삭제
+      (락이 만료되어 다른 작업이 동시에 실행되어도 서로 다른 내역을 처리)
+    - 저장 실패 시 보관된 내역은 recover_point_batches에서 재처리
+    :return int: 처리 건수 (잘못된 데이터 포함)
+    """
+
+    batch_id, entries = claim_point_batch_sync(batch_size)
+    if not entries:
+        return 0
+
+    save_point_entries(entries)
+    finish_point_batch_sync(batch_id)
+    return len(entries)
+
+
+def recover_point_batches(older_than: float) -> int:
+    """가져간 뒤 older_than초가 지나도록 삭제되지 않은 batch 재처리 (중복은 unique key로 제외)"""
+
+    recovered = 0
+    for batch_id in get_stale_point_batches_sync(older_than):
+        entries = get_point_batch_sync(batch_id)
+        if entries:
+            save_point_entries(entries)
+            recovered += len(entries)
+        finish_point_batch_sync(batch_id)
+
+    return recovered
+
+
+@celery_app.task(name="flush_buffered_points")
+def flush_buffered_points(max_batches: int = 50):
+    """
+    Redis에 적재된 포인트 적립 내역을 DB에 일괄 저장 (POINT_ACCRUAL_MODE=buffered)
+    - 동시에 하나의 작업만 실행 (Redis 락)
+    - 이전 실행에서 저장하지 못한 batch 먼저 재처리
+    """
+
+    lock_timeout = max(POINT_FLUSH_INTERVAL * 6, 30)
+    lock_token = acquire_lock_sync(FLUSH_LOCK_KEY, lock_timeout)
+    if lock_token is None:
+        return
+
+    flushed = 0
+    try:
+        flushed += recover_point_batches(older_than=lock_timeout)
+        for _ in range(max_batches):
+            count = flush_point_batch(POINT_FLUSH_BATCH_SIZE)
+            flushed += count
+            if count < POINT_FLUSH_BATCH_SIZE:
+                break
+
+    except (SQLAlchemyError, RedisError) as e:
+        print("[ERROR] 포인트 일괄 저장 실패:", e)
+
+    finally:
+        if not release_lock_sync(FLUSH_LOCK_KEY, lock_token):
+            print(
+                "[ERROR] flush_buffered_points 실행 중 락 만료 (다른 작업과 동시 실행 가능)"
+            )
+
+    if flushed:
+        print(f"[INFO] 포인트 적립 내역 {flushed}건 처리")
+
+
+@celery_app.task(name="recompute_point_balances")
+def recompute_point_balances():
+    """
+    유저 포인트 합계를 user_video_points 기준으로 다시 계산 (배포 완료 후 1회 실행)
+
+    - 합계 테이블 마이그레이션(backfill) 이후 ~ 배포 완료 전까지
+      이전 버전 서버가 저장한 포인트는 합계에 반영되지 않으므로 보정
+    - 기업마다 한 트랜잭션, 계산 중에는 포인트 적립(insert)이 대기하도록 SHARE 잠금
+      (계산 도중 커밋된 적립이 합계 덮어쓰기로 사라지지 않도록)
+    - 합계가 바뀐 기업은 순위표 재생성, 여러 번 실행해도 결과 동일
+    """
+
+    with sync_session() as db:
+        organization_ids = list(db.scalars(select(Organization.id)))
+
+    changed_orgs = []
+    updated = 0
+    try:
+        for organization_id in organization_ids:
+            with sync_session() as db, db.begin():
+                db.execute(text("LOCK TABLE user_video_points IN SHARE MODE"))
+                user_ids = db.execute(
+                    make_point_balance_recompute(organization_id)
+                ).all()
+
+            if user_ids:
+                changed_orgs.append(organization_id)
+                updated += len(user_ids)
+
+        invalidate_leaderboards_sync(changed_orgs)
+
+    except (SQLAlchemyError, RedisError) as e:
+        print("[ERROR] 포인트 합계 재계산 실패:", e)
+
+    print(f"[INFO] 포인트 합계 {updated}건 보정 ({len(changed_orgs)}개 기업)")
+    return {"updated": updated, "organizations": len(changed_orgs)}
+
+
+def save_import_batch(db, organization_id: int, importer: UserImporter) -> None:
+    """batch 비밀번호 병렬 해시 후 일괄 저장 (이미 있는 이메일은 해시 생략)"""
+
+    batch = importer.take_batch()
+    if not batch:
+        return
+
+    emails = [user.email for _, user in batch]
+    existing = set(
+        db.scalars(
+            select(User.email).where(
+                User.organization_id == organization_id, User.email.in_(emails)
+            )
+        )
+    )
+    db.commit()  # 해시 동안 트랜잭션을 열어두지 않음
+
+    new_users = [(line, user) for line, user in batch if user.email not in existing]
+    created = set()
+    if new_users:
+        hashed_passwords = hash_passwords([user.password for _, user in new_users])
+        try:
+            rows = make_import_rows(organization_id, new_users, hashed_passwords)
+            created = set(db.execute(make_user_bulk_insert(), rows).scalars())
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+
+    importer.record_batch(batch, created)
+
+
+@celery_app.task(name="import_users")
+def import_users(job_id: str, organization_id: int, fmt: str, tmp_path: str):
+    """
+    유저 일괄 등록 작업 (POST /admin/user/import/jobs)
+    - batch 저장마다 진행 상태 갱신, 완료 시 실패 행 목록 저장
+    - 임시 파일은 성공 / 실패와 관계없이 삭제
+    """
+
+    importer = UserImporter(fmt)
+    status = "FAILED"
+    try:
+        update_import_job_sync(job_id, "RUNNING", importer.result)
+
+        with open(tmp_path, encoding="utf-8-sig", errors="replace") as f:
+            with sync_session() as db:
+                for line in f:
+                    if importer.add_line(line):
+                        save_import_batch(db, organization_id, importer)
+                        update_import_job_sync(job_id, "RUNNING", importer.result)
+                save_import_batch(db, organization_id, importer)
+
+        status = "DONE"
+
+    except AppBaseException as e:
+        importer.add_error(importer.line_no, None, e.detail)
+
+    except (SQLAlchemyError, RedisError, OSError) as e:
+        print("[ERROR] 유저 일괄 등록 실패:", e)
+
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    try:
+        update_import_job_sync(job_id, status, importer.result, finished=True)
+    except RedisError as e:
+        print("[ERROR]", e)
+
+    print(
+        f"[INFO] 유저 일괄 등록 {status}: 생성 {importer.result.created}건, "
+        f"실패 {importer.result.failed}건"
+    )
@@ -1,10 +1,145 @@
-from sqlalchemy import select, and_
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, and_, exists, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from celery import chord
 
+from src.core.config import (
+    DEFAULT_RENDITIONS,
+    TEMP_UPLOAD_DIR,
+    UPLOAD_SESSION_TTL,
+    BLOB_GC_GRACE_SECONDS,
+)
 from src.db.sync_session import sync_session
 from src.core.celery.app import celery_app
-from src.video.models import Video
-from src.video.utils import upload_video_file
+from src.video.models import Video, VideoBlob
+from src.core.storage import get_storage
+from src.organization.models import OrganizationPlan, OrganizationSubscription
+from src.video.processing import (
+    RENDITIONS,
+    SOURCE_RENDITION,
+    Variant,
+    VideoProbe,
+    VideoProcessingError,
+    create_hls,
+    ensure_faststart,
+    get_hls_prefix,
+    get_master_playlist_key,
+    get_rendition_prefix,
+    make_master_playlist,
+    make_variant,
+    probe_video,
+    put_text,
+    select_renditions,
+)
+from src.video.utils import get_blob_key, hash_file, store_blob
+
+
+def store_blob_file(tmp_path: str, content_hash: str | None) -> tuple[str, int, bool]:
+    """
+    임시 파일을 blob 저장소에 저장 (DB 트랜잭션 밖에서 실행)
+
+    - 저장 key가 파일 해시이므로 다시 실행해도 결과 동일
+    - 같은 해시 파일이 이미 있으면 임시 파일은 남겨두고 커밋 후 finish_blob에서 정리
+    :return: (content_hash, 파일 크기, 새로 저장한 파일 여부)
+    """
+
+    content_hash = content_hash or hash_file(tmp_path)
+    size = os.path.getsize(tmp_path)
+    created = store_blob(tmp_path, get_blob_key(content_hash))
+
+    return content_hash, size, created
+
+
+def acquire_blob(db: Session, content_hash: str, size: int) -> VideoBlob:
+    """
+    blob 참조 수 증가 (없으면 생성)
+    - blob row 락은 커밋까지 유지되므로 파일 저장 후 호출, 이후 바로 커밋
+    """
+
+    stmt = (
+        insert(VideoBlob)
+        .values(
+            content_hash=content_hash,
+            path=get_blob_key(content_hash),
+            size=size,
+            ref_count=1,
+        )
+        .on_conflict_do_update(
+            index_elements=[VideoBlob.content_hash],
+            set_={"ref_count": VideoBlob.ref_count + 1, "updated_at": func.now()},
+        )
+        .returning(VideoBlob)
+    )
+    return db.execute(stmt).scalar_one()
+
+
+def finish_blob(tmp_path: str, content_hash: str) -> None:
+    """
+    커밋 후 남은 임시 파일 정리
+    - 저장 시 있던 파일을 커밋 전에 GC가 삭제했으면 임시 파일로 다시 저장
+      (참조 수가 커밋되었으므로 이후 GC 대상 아님)
+    """
+
+    if os.path.exists(tmp_path):
+        store_blob(tmp_path, get_blob_key(content_hash))
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+
+def discard_blob(db: Session, content_hash: str, created: bool) -> None:
+    """
+    작업 실패 시 새로 저장한 blob 파일 삭제 (row 없는 파일 방지)
+    - 같은 파일을 다른 작업이 등록한 경우(row 존재) 유지
+    """
+
+    if not created:
+        return
+
+    try:
+        registered = db.execute(
+            select(exists().where(VideoBlob.content_hash == content_hash))
+        ).scalar()
+        db.rollback()
+        if not registered:
+            get_storage().delete(get_blob_key(content_hash))
+    except Exception as e:
+        print("[ERROR] blob 파일 정리 실패:", content_hash, e)
+
+
+def prepare_video_file(tmp_path: str, content_hash: str | None):
+    """
+    업로드 파일 faststart 변환 (moov atom 앞쪽 배치 -> 첫 프레임 재생 지연 감소)
+    - 파일이 변경되면 해시를 다시 계산하도록 None 반환
+    - 변환 실패 시 원본 그대로 저장, faststart 여부는 미확인(None)
+    - ffmpeg 실행 시간이 길 수 있으므로 DB 트랜잭션 시작 전에 호출
+
+    :return: (content_hash, faststart 여부)
+    """
+
+    try:
+        faststart, changed = ensure_faststart(tmp_path)
+    except (VideoProcessingError, OSError) as e:
+        print("[ERROR] faststart 변환 실패:", e)
+        return content_hash, None
+
+    return (None if changed else content_hash), faststart
+
+
+def release_blob(db: Session, content_hash: str) -> None:
+    """blob 참조 수 감소 - 0이 된 blob은 GC 작업에서 삭제"""
+
+    db.execute(
+        update(VideoBlob)
+        .where(VideoBlob.content_hash == content_hash)
+        .values(ref_count=VideoBlob.ref_count - 1)
+    )
 
 
 @celery_app.task(name="process_video_upload")
@@ -16,30 +151,37 @@ def process_video_upload(payload: dict):
     title = payload["title"]
     description = payload["description"]
     tmp_path = payload["tmp_path"]
+    content_hash = payload.get("content_hash")
 
-    try:
-        dest_path = upload_video_file(tmp_path, organization_id)
-    except Exception as file_error:
-        print("[ERROR] 파일 업로드 중 오류 작업 실패:", file_error)
-        return
-
+    created = False
     with sync_session() as db:
         try:
+            content_hash, faststart = prepare_video_file(tmp_path, content_hash)
+            content_hash, size, created = store_blob_file(tmp_path, content_hash)
+            blob = acquire_blob(db, content_hash, size)
+
             new_video = Video(
                 user_id=user_id,
                 organization_id=organization_id,
                 title=title,
                 description=description,
-                path=dest_path,
+                path=blob.path,
+                content_hash=blob.content_hash,
+                is_faststart=faststart,
             )
             db.add(new_video)
             db.commit()
             db.refresh(new_video)
+            finish_blob(tmp_path, content_hash)
             print(f"[UPDATED] Video {new_video.id} 업로드 완료")
 
+            process_video_hls.delay(new_video.id)
+
         except Exception as e:
             db.rollback()
             print("[ERROR] Video 업로드 작업 실패:", e)
+            if content_hash:
+                discard_blob(db, content_hash, created)
 
 
 @celery_app.task(name="process_video_update")
@@ -49,36 +191,230 @@ def process_video_update(payload: dict):
     video_id = payload["video_id"]
     title = payload.get("title")
     description = payload.get("description")
-    organization_id = payload["organization_id"]
     tmp_path = payload.get("tmp_path")
-    new_path = None
+    content_hash = payload.get("content_hash")
 
-    try:
-        if tmp_path:
-            new_path = upload_video_file(tmp_path, organization_id)
-    except Exception as file_error:
-        print("[ERROR] 파일 업로드 중 오류 작업 실패:", file_error)
-        return
+    created = False
+    with sync_session() as db:
+        try:
+            # 첫 쿼리 전에 변환 / 파일 저장 (파일 작업 동안 DB 연결이 idle in transaction으로 남지 않도록)
+            if tmp_path:
+                content_hash, faststart = prepare_video_file(tmp_path, content_hash)
+                content_hash, size, created = store_blob_file(tmp_path, content_hash)
 
-    try:
-        with sync_session() as db:
             video = db.execute(
                 select(Video).where(
                     and_(Video.id == video_id, Video.is_deleted.is_(False))
                 )
             ).scalar()
 
-            if video is not None:
-                if new_path:
-                    video.path = new_path
-                if title:
-                    video.title = title
-                if description:
-                    video.description = description
+            if video is None:
+                if tmp_path:
+                    db.rollback()
+                    discard_blob(db, content_hash, created)
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                return
 
-                db.commit()
-                print(f"[UPDATED] Video {video_id} 업데이트 완료")
+            if tmp_path:
+                blob = acquire_blob(db, content_hash, size)
+                if video.content_hash:
+                    # 기존 파일 참조 해제 (같은 파일 재업로드면 참조 수 변화 없음)
+                    release_blob(db, video.content_hash)
 
-    except SQLAlchemyError as e:
-        db.rollback()
-        print("[ERROR] Video DB 업데이트 실패 :", e)
+                if video.content_hash != blob.content_hash:
+                    video.hls_playlist = None
+                video.path = blob.path
+                video.content_hash = blob.content_hash
+                video.is_faststart = faststart
+            if title:
+                video.title = title
+            if description:
+                video.description = description
+
+            db.commit()
+            if tmp_path:
+                finish_blob(tmp_path, content_hash)
+            print(f"[UPDATED] Video {video_id} 업데이트 완료")
+
+            if video.hls_playlist is None:
+                process_video_hls.delay(video.id)
+
+        except Exception as e:
+            db.rollback()
+            print("[ERROR] Video DB 업데이트 실패 :", e)
+            if tmp_path and content_hash:
+                discard_blob(db, content_hash, created)
+
+
+def get_organization_renditions(db: Session, organization_id: int) -> list[str]:
+    """기업의 현재 구독 플랜 ABR 변환 목록 (없으면 기본값)"""
+
+    renditions = db.execute(
+        select(OrganizationPlan.renditions)
+        .join(OrganizationSubscription.plan)
+        .where(
+            OrganizationSubscription.organization_id == organization_id,
+            OrganizationSubscription.is_active == True,
+        )
+        .order_by(OrganizationSubscription.start_date.desc())
+        .limit(1)
+    ).scalar()
+
+    return renditions or DEFAULT_RENDITIONS
+
+
+@celery_app.task(
+    name="process_video_hls",
+    autoretry_for=(VideoProcessingError,),
+    retry_backoff=60,
+    max_retries=3,
+)
+def process_video_hls(video_id: int):
+    """
+    업로드된 영상을 ABR HLS로 변환
+
+    - 기업 플랜의 화질 목록마다 하위 작업 실행 (chord로 여러 워커에서 병렬 처리)
+    - 원본보다 높은 화질은 제외, 해당 화질이 없으면 원본 화질로 분할
+    - 모든 화질 변환이 끝나면 finalize_video_hls에서 영상에 반영
+    """
+
+    with sync_session() as db:
+        video = db.execute(
+            select(Video).where(and_(Video.id == video_id, Video.is_deleted.is_(False)))
+        ).scalar()
+        if video is None or not video.content_hash or video.hls_playlist:
+            return
+
+        source_key = video.path
+        content_hash = video.content_hash
+        names = get_organization_renditions(db, video.organization_id)
+
+    probe = probe_video(get_storage().presign(source_key))
+    rendition_names = [
+        rendition.name for rendition in select_renditions(names, probe.height)
+    ] or [SOURCE_RENDITION]
+
+    header = [
+        transcode_rendition.s(source_key, content_hash, name, probe.model_dump())
+        for name in rendition_names
+    ]
+    chord(header)(finalize_video_hls.s(video_id, content_hash))
+
+
+@celery_app.task(
+    name="transcode_rendition",
+    autoretry_for=(VideoProcessingError,),
+    retry_backoff=60,
+    max_retries=3,
+)
+def transcode_rendition(source_key: str, content_hash: str, name: str, probe: dict):
+    """
+    화질 하나를 HLS로 변환 - 같은 파일 / 같은 화질은 결과물 재사용
+
+    :return dict: master 플레이리스트 항목 (Variant)
+    """
+
+    rendition = RENDITIONS.get(name)  # SOURCE_RENDITION이면 재인코딩 없이 분할
+    create_hls(source_key, get_rendition_prefix(content_hash, name), rendition)
+
+    return make_variant(rendition, VideoProbe(**probe)).model_dump()
+
+
+@celery_app.task(name="finalize_video_hls")
+def finalize_video_hls(variants: list[dict], video_id: int, content_hash: str):
+    """
+    master 플레이리스트 생성 후 영상에 반영
+    - 변환 중 영상 파일이 교체되면 결과를 반영하지 않음
+    """
+
+    variants = [Variant(**variant) for variant in variants]
+    master_key = get_master_playlist_key(content_hash, [v.name for v in variants])
+    if not get_storage().exists(master_key):
+        put_text(master_key, make_master_playlist(variants, content_hash))
+
+    with sync_session() as db:
+        try:
+            result = db.execute(
+                update(Video)
+                .where(Video.id == video_id, Video.content_hash == content_hash)
+                .values(hls_playlist=master_key)
+            )
+            db.commit()
+            if result.rowcount:
+                print(f"[UPDATED] Video {video_id} HLS 변환 완료")
+
+        except SQLAlchemyError as e:
+            db.rollback()
+            print("[ERROR] Video HLS 정보 저장 실패:", e)
+
+
+@celery_app.task(name="collect_unreferenced_blobs")
+def collect_unreferenced_blobs(batch_size: int = 100):
+    """
+    참조하는 영상이 없는 blob 파일 및 row 삭제
+
+    - FOR UPDATE로 잠근 row의 ref_count를 다시 확인하므로 그 사이 참조된 blob은 제외
+    - 파일 삭제 ~ row 삭제 커밋까지 row 락 유지, 같은 해시 업로드의 참조 수 증가는 대기
+      (대기 후 새 row 생성, 파일은 업로드 작업의 finish_blob에서 다시 저장)
+    """
+
+    expired_at = datetime.now() - timedelta(seconds=BLOB_GC_GRACE_SECONDS)
+    removed = 0
+    storage = get_storage()
+
+    with sync_session() as db:
+        try:
+            blobs = (
+                db.execute(
+                    select(VideoBlob)
+                    .where(
+                        VideoBlob.ref_count <= 0,
+                        VideoBlob.updated_at <= expired_at,
+                        ~exists().where(Video.content_hash == VideoBlob.content_hash),
+                    )
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                .scalars()
+                .all()
+            )
+
+            for blob in blobs:
+                storage.delete(blob.path)
+                storage.delete_prefix(get_hls_prefix(blob.content_hash))
+                db.delete(blob)
+                removed += 1
+
+            db.commit()
+            print(f"[INFO] 미사용 blob {removed}개 삭제")
+
+        except SQLAlchemyError as e:
+            db.rollback()
+            print("[ERROR] blob 정리 작업 실패:", e)
+
+
+@celery_app.task(name="cleanup_stale_temp_files")
+def cleanup_stale_temp_files():
+    """업로드 세션 만료 등으로 남은 임시 파일 삭제"""
+
+    if not os.path.isdir(TEMP_UPLOAD_DIR):
+        return
+
+    expired_at = time.time() - UPLOAD_SESSION_TTL
+    removed = 0
+
+    for entry in os.scandir(TEMP_UPLOAD_DIR):
+        try:
+            if entry.stat().st_mtime >= expired_at:
+                continue
+            if entry.is_dir():
+                # 중단된 HLS 변환 작업 디렉토리
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+            removed += 1
+        except OSError as e:
+            print("[ERROR] 임시 파일 삭제 실패:", e)
+
+    print(f"[INFO] 임시 파일 {removed}개 삭제")
@@ -2,6 +2,8 @@ import os
 
 from aioredlock import Aioredlock
 from dotenv import load_dotenv
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
 
 load_dotenv()
 
@@ -9,16 +11,116 @@ load_dotenv()
 DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
 SYNC_DATABASE_URL = os.getenv("SYNC_DATABASE_URL")
 
+# DB Query : SQL 실행 시간 집계 / 느린 쿼리 로그
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"  # 모든 SQL 출력 (개발용)
+DB_QUERY_STATS = os.getenv("DB_QUERY_STATS", "true").lower() == "true"
+DB_QUERY_STATS_MAX = int(
+    os.getenv("DB_QUERY_STATS_MAX", "500")
+)  # 집계할 쿼리 종류 상한
+# 초, 이 시간 이상 걸린 쿼리는 로그 출력 (0이면 출력 안함)
+DB_SLOW_QUERY_SECONDS = float(os.getenv("DB_SLOW_QUERY_SECONDS", "0.5"))
+
+# Read Replica : 쉼표 구분 비동기 DB URL, 비어 있으면 모든 쿼리를 primary로 처리
+READ_REPLICA_URLS = [
+    url.strip() for url in os.getenv("READ_REPLICA_URLS", "").split(",") if url.strip()
+]
+READ_REPLICA_RETRY_SECONDS = int(
+    os.getenv("READ_REPLICA_RETRY_SECONDS", "30")
+)  # 장애 replica 제외 시간
+
+# DB Pool : 프로세스(API 서버 worker, celery worker)마다 적용
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # 초, 연결 대기 상한
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 초, -1이면 재생성 안함
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# true면 PgBouncer(transaction pooling) 호환 - prepared statement 캐시 사용 안함
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
 # Token
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM")
 ACCESS_TOKEN_EXPIRE_WEEKS = int(os.getenv("ACCESS_TOKEN_EXPIRE_WEEKS"))
 REFRESH_TOKEN_EXPIRE_WEEKS = int(os.getenv("REFRESH_TOKEN_EXPIRE_WEEKS"))
+# 운영자 전용 API (서버 지표 등) 접근 토큰, 설정하지 않으면 해당 API 사용 안함
+OPERATOR_TOKEN = os.getenv("OPERATOR_TOKEN")
 
 # Static
 TEMP_UPLOAD_DIR = os.getenv("TEMP_UPLOAD_DIR")
 UPLOAD_DIR = os.getenv("UPLOAD_DIR")
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1048576"))  # 1MB 기본값
+UPLOAD_BUFFER_SIZE = int(os.getenv("UPLOAD_BUFFER_SIZE", "8388608"))  # 8MB 기본값
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", "10737418240"))  # 10GB 기본값
+# 참조가 없어진 blob 삭제 유예 시간(초)
+BLOB_GC_GRACE_SECONDS = int(os.getenv("BLOB_GC_GRACE_SECONDS", "3600"))
+
+# Storage : local | s3 (S3 호환 저장소, MinIO 등)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
+S3_BUCKET = os.getenv("S3_BUCKET", "videos")
+S3_ACCESS_KEY = os.getenv("S3_ACCESS_KEY")
+S3_SECRET_KEY = os.getenv("S3_SECRET_KEY")
+S3_REGION = os.getenv("S3_REGION", "us-east-1")
+S3_MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD", "67108864"))  # 64MB
+S3_MULTIPART_CHUNK_SIZE = int(os.getenv("S3_MULTIPART_CHUNK_SIZE", "67108864"))
+# 영상 전송 방식 : auto(서버 지원 시 sendfile) | buffered
+VIDEO_SEND_BACKEND = os.getenv("VIDEO_SEND_BACKEND", "auto")
+
+# Video Processing (ffmpeg)
+FFMPEG_PATH = os.getenv("FFMPEG_PATH", "ffmpeg")
+FFPROBE_PATH = os.getenv("FFPROBE_PATH", "ffprobe")
+FFMPEG_TIMEOUT = int(os.getenv("FFMPEG_TIMEOUT", "3600"))  # 초
+HLS_SEGMENT_SECONDS = int(os.getenv("HLS_SEGMENT_SECONDS", "6"))
+# 플랜에 변환 목록이 없을 때 사용하는 ABR rendition (쉼표 구분)
+DEFAULT_RENDITIONS = os.getenv("DEFAULT_RENDITIONS", "720p,480p,360p").split(",")
+
+# Resumable Upload
+UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL", "86400"))  # 초, 1일
+UPLOAD_CHUNK_LOCK_TIMEOUT = int(os.getenv("UPLOAD_CHUNK_LOCK_TIMEOUT", "300"))  # 초
+UPLOAD_CHUNK_CONCURRENCY = int(os.getenv("UPLOAD_CHUNK_CONCURRENCY", "8"))
+
+# Point : lock(요청마다 분산 락 + DB 저장) | buffered(Redis 적재 후 일괄 저장)
+#         | idempotent(락 없이 DB unique key로 중복 방지)
+POINT_ACCRUAL_MODE = os.getenv("POINT_ACCRUAL_MODE", "lock")
+POINT_DEDUP_WINDOW = int(os.getenv("POINT_DEDUP_WINDOW", "60"))  # 초, 중복 적립 방지
+POINT_FLUSH_INTERVAL = int(os.getenv("POINT_FLUSH_INTERVAL", "5"))  # 초
+POINT_FLUSH_BATCH_SIZE = int(os.getenv("POINT_FLUSH_BATCH_SIZE", "1000"))
+
+# Subscription Expire : 만료 유료 구독 일괄 처리 (chunk 단위 트랜잭션)
+SUBSCRIPTION_EXPIRE_BATCH_SIZE = int(
+    os.getenv("SUBSCRIPTION_EXPIRE_BATCH_SIZE", "1000")
+)
+# 초, 만료 예약(Redis sorted set) 확인 주기
+SUBSCRIPTION_EXPIRY_POLL_INTERVAL = int(
+    os.getenv("SUBSCRIPTION_EXPIRY_POLL_INTERVAL", "60")
+)
+
+# Auth Cache : 로그인 유저 캐시
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", "30"))  # 초, 0이면 사용 안함
+AUTH_CACHE_MAXSIZE = int(os.getenv("AUTH_CACHE_MAXSIZE", "10000"))
+# true면 프로세스 캐시 뒤에 Redis 캐시 추가 (API 서버 간 공유)
+AUTH_CACHE_REDIS = os.getenv("AUTH_CACHE_REDIS", "false").lower() == "true"
+
+# User Import : 유저 일괄 등록 (CSV / NDJSON)
+USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "500"))
+USER_IMPORT_MAX_SIZE = int(os.getenv("USER_IMPORT_MAX_SIZE", "52428800"))  # 50MB
+USER_IMPORT_MAX_ERRORS = int(
+    os.getenv("USER_IMPORT_MAX_ERRORS", "1000")
+)  # 응답 오류 행 수
+USER_IMPORT_JOB_TTL = int(
+    os.getenv("USER_IMPORT_JOB_TTL", "86400")
+)  # 초, 작업 진행 상태 보관
+
+# Password Hash : bcrypt 전용 스레드 풀 (이벤트 루프 블로킹 방지)
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# 실행 대기 요청 상한, 초과 시 503 응답 (0이면 제한 없음)
+PASSWORD_HASH_MAX_WAITING = int(os.getenv("PASSWORD_HASH_MAX_WAITING", "100"))
+
+# Entitlement Cache : 기업 플랜 권한 캐시 (변경 시 Redis pub/sub으로 전체 서버 무효화)
+ENTITLEMENT_CACHE_TTL = int(os.getenv("ENTITLEMENT_CACHE_TTL", "300"))  # 초
+ENTITLEMENT_CACHE_MAXSIZE = int(os.getenv("ENTITLEMENT_CACHE_MAXSIZE", "10000"))
 
 # Redis
 REDIS_HOST_1 = os.getenv("REDIS_HOST_1", "localhost")
@@ -33,3 +135,6 @@ LOCK_MANAGER = Aioredlock(
     ],
     retry_count=1,
 )
+REDIS_CLIENT = Redis(host=REDIS_HOST_1, port=REDIS_PORT, decode_responses=True)
+# celery 작업용
+SYNC_REDIS_CLIENT = SyncRedis(host=REDIS_HOST_1, port=REDIS_PORT, decode_responses=True)
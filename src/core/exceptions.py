@@ -4,8 +4,13 @@ from fastapi import HTTPException, status
 class AppBaseException(HTTPException):
     """모든 커스텀 예외의 부모 클래스"""
 
-    def __init__(self, detail: str, status_code: int = status.HTTP_400_BAD_REQUEST):
-        super().__init__(status_code=status_code, detail=detail)
+    def __init__(
+        self,
+        detail: str,
+        status_code: int = status.HTTP_400_BAD_REQUEST,
+        headers: dict[str, str] | None = None,
+    ):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
 
 
 class InternalServerErrorException(AppBaseException):
@@ -36,3 +41,14 @@ class DuplicateDataException(AppBaseException):
             detail=detail,
             status_code=status.HTTP_409_CONFLICT,
         )
+
+
+class ServiceUnavailableException(AppBaseException):
+    def __init__(
+        self, detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+    ):
+        super().__init__(
+            detail=detail,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+        )
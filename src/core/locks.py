@@ -0,0 +1,45 @@
+import uuid
+
+from src.core.config import REDIS_CLIENT, SYNC_REDIS_CLIENT
+
+# token이 일치할 때만 삭제 - 락 TTL이 지난 뒤 다른 요청이 획득한 락은 유지
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+release_lock_script = REDIS_CLIENT.register_script(RELEASE_LOCK_SCRIPT)
+release_lock_script_sync = SYNC_REDIS_CLIENT.register_script(RELEASE_LOCK_SCRIPT)
+
+
+async def acquire_lock(key: str, timeout: int) -> str | None:
+    """
+    Redis 락 획득 (SET NX EX)
+
+    :return str | None: 해제 시 사용할 token, 이미 잠겨 있으면 None
+    """
+
+    token = uuid.uuid4().hex
+    if await REDIS_CLIENT.set(key, token, nx=True, ex=timeout):
+        return token
+    return None
+
+
+async def release_lock(key: str, token: str) -> bool:
+    """자신이 획득한 락만 해제, 이미 만료되어 다른 요청이 획득한 경우 False"""
+    return bool(await release_lock_script(keys=[key], args=[token]))
+
+
+def acquire_lock_sync(key: str, timeout: int) -> str | None:
+    """celery 작업용 - acquire_lock과 동일"""
+
+    token = uuid.uuid4().hex
+    if SYNC_REDIS_CLIENT.set(key, token, nx=True, ex=timeout):
+        return token
+    return None
+
+
+def release_lock_sync(key: str, token: str) -> bool:
+    """celery 작업용 - release_lock과 동일"""
+    return bool(release_lock_script_sync(keys=[key], args=[token]))
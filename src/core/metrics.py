@@ -0,0 +1,117 @@
+import threading
+from bisect import bisect_left
+from typing import Callable
+
+# 초 단위 기본 구간 (5ms ~ 10s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Counter:
+    """누적 카운터"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self.lock:
+            self.value += amount
+
+    def collect(self) -> dict:
+        return {"type": "counter", "value": self.value}
+
+
+class Gauge:
+    """현재 값 (대기 중 작업 수 등)"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount: int = 1) -> None:
+        with self.lock:
+            self.value -= amount
+
+    def set(self, value) -> None:
+        self.value = value
+
+    def collect(self) -> dict:
+        return {"type": "gauge", "value": self.value}
+
+
+class Histogram:
+    """구간별 관측 횟수 + 합계 (소요 시간 분포)"""
+
+    def __init__(self, name: str, description: str, buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 구간: +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self.lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.sum += value
+            self.count += 1
+
+    def collect(self) -> dict:
+        with self.lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+
+        # 누적 개수 (value <= le)
+        buckets = {}
+        cumulative = 0
+        for le, n in zip([*map(str, self.buckets), "+Inf"], counts):
+            cumulative += n
+            buckets[le] = cumulative
+
+        return {"type": "histogram", "count": count, "sum": total, "buckets": buckets}
+
+
+REGISTRY: dict[str, Counter | Gauge | Histogram] = {}
+COLLECTORS: dict[str, Callable[[], object]] = {}  # 조회 시점에 계산하는 지표
+
+
+def register(metric):
+    """같은 이름이 이미 있으면 기존 지표 반환"""
+    return REGISTRY.setdefault(metric.name, metric)
+
+
+def counter(name: str, description: str) -> Counter:
+    return register(Counter(name, description))
+
+
+def gauge(name: str, description: str) -> Gauge:
+    return register(Gauge(name, description))
+
+
+def histogram(
+    name: str, description: str, buckets: tuple = DEFAULT_BUCKETS
+) -> Histogram:
+    return register(Histogram(name, description, buckets))
+
+
+def register_collector(name: str, collect: Callable[[], object]) -> None:
+    COLLECTORS[name] = collect
+
+
+def collect_metrics() -> dict[str, object]:
+    result = {
+        name: {"description": metric.description, **metric.collect()}
+        for name, metric in sorted(REGISTRY.items())
+    }
+    for name, collect in sorted(COLLECTORS.items()):
+        result[name] = collect()
+    return result
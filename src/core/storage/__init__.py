@@ -0,0 +1,39 @@
+from functools import lru_cache
+
+from src.core.config import (
+    STORAGE_BACKEND,
+    UPLOAD_DIR,
+    S3_ENDPOINT_URL,
+    S3_BUCKET,
+    S3_ACCESS_KEY,
+    S3_SECRET_KEY,
+    S3_REGION,
+    S3_MULTIPART_THRESHOLD,
+    S3_MULTIPART_CHUNK_SIZE,
+)
+from src.core.storage.base import StorageBackend, StorageStat
+
+
+@lru_cache
+def get_storage() -> StorageBackend:
+    """설정(STORAGE_BACKEND)에 따른 저장소 반환"""
+
+    if STORAGE_BACKEND == "s3":
+        from src.core.storage.s3 import S3Storage
+
+        return S3Storage(
+            endpoint_url=S3_ENDPOINT_URL,
+            bucket=S3_BUCKET,
+            access_key=S3_ACCESS_KEY,
+            secret_key=S3_SECRET_KEY,
+            region=S3_REGION,
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunk_size=S3_MULTIPART_CHUNK_SIZE,
+        )
+
+    from src.core.storage.local import LocalStorage
+
+    return LocalStorage(root=UPLOAD_DIR)
+
+
+__all__ = ["get_storage", "StorageBackend", "StorageStat"]
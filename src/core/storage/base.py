@@ -0,0 +1,64 @@
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+
+class StorageStat(BaseModel):
+    """저장 객체 정보"""
+
+    size: int
+    modified_at: datetime
+
+
+class StorageBackend(ABC):
+    """영상 파일 저장소 인터페이스 - key는 저장소 내 상대 경로"""
+
+    @abstractmethod
+    def put_file(self, key: str, local_path: str) -> None:
+        """로컬 파일 저장 (대용량 파일은 multipart 업로드)"""
+
+    def move_file(self, key: str, local_path: str) -> None:
+        """로컬 파일 저장 후 원본 삭제"""
+        self.put_file(key, local_path)
+        os.remove(local_path)
+
+    @abstractmethod
+    def stat(self, key: str) -> StorageStat | None:
+        """객체 정보 조회, 없으면 None"""
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """객체 삭제, 없는 객체는 무시"""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """prefix 하위 객체 일괄 삭제 (HLS 세그먼트 등)"""
+
+    @abstractmethod
+    def presign(self, key: str, expires_in: int = 3600) -> str:
+        """임시 다운로드 URL 생성"""
+
+    @abstractmethod
+    def download_file(self, key: str, dest_path: str) -> None:
+        """객체를 로컬 파일로 다운로드"""
+
+    @abstractmethod
+    def get_range(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        객체 범위 읽기 (스트리밍)
+
+        :param start int: 시작 바이트 위치
+        :param end int | None: 마지막 바이트 위치(포함), None이면 끝까지
+        """
+
+    def local_path(self, key: str) -> str | None:
+        """로컬 디스크 경로 (sendfile 전송용), 원격 저장소는 None"""
+        return None
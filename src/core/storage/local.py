@@ -0,0 +1,78 @@
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+import aiofiles as aio
+
+from src.core.config import CHUNK_SIZE
+from src.core.storage.base import StorageBackend, StorageStat
+
+
+class LocalStorage(StorageBackend):
+    """로컬 디스크 저장소 (UPLOAD_DIR 기준)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def local_path(self, key: str) -> str:
+        # 이전 버전에서 저장한 경로(UPLOAD_DIR 포함, 절대 경로)는 그대로 사용
+        root = os.path.normpath(self.root)
+        if os.path.isabs(key) or os.path.normpath(key).startswith(root + os.sep):
+            return key
+
+        return os.path.join(self.root, key)
+
+    def put_file(self, key: str, local_path: str) -> None:
+        dest_path = self.local_path(key)
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        shutil.copyfile(local_path, dest_path)
+
+    def move_file(self, key: str, local_path: str) -> None:
+        """같은 디스크라면 복사 없이 이동"""
+        dest_path = self.local_path(key)
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        shutil.move(local_path, dest_path)
+
+    def stat(self, key: str) -> StorageStat | None:
+        try:
+            file_stat = os.stat(self.local_path(key))
+        except FileNotFoundError:
+            return None
+
+        return StorageStat(
+            size=file_stat.st_size,
+            modified_at=datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+        )
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.local_path(key))
+        except FileNotFoundError:
+            pass
+
+    def delete_prefix(self, prefix: str) -> None:
+        shutil.rmtree(self.local_path(prefix), ignore_errors=True)
+
+    def presign(self, key: str, expires_in: int = 3600) -> str:
+        # 로컬 저장소는 API 서버를 통해서만 제공
+        return self.local_path(key)
+
+    def download_file(self, key: str, dest_path: str) -> None:
+        shutil.copyfile(self.local_path(key), dest_path)
+
+    async def get_range(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        async with aio.open(self.local_path(key), "rb") as video_file:
+            await video_file.seek(start)
+            remaining = None if end is None else end - start + 1
+
+            while remaining is None or remaining > 0:
+                size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+                chunk = await video_file.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
@@ -0,0 +1,158 @@
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core import metrics
+from src.core.config import (
+    DB_QUERY_STATS,
+    DB_QUERY_STATS_MAX,
+    DB_SLOW_QUERY_SECONDS,
+)
+
+# 쿼리 실행 시간 구간 (초)
+QUERY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10)
+OTHER_STATEMENT = "(other)"  # DB_QUERY_STATS_MAX 초과 쿼리
+TOP_CALLERS = 5
+
+PARAM_PATTERN = re.compile(r"\$\d+|%\(\w+\)s|%s|\b\d+(?:\.\d+)?\b|'(?:[^']|'')*'")
+PARAM_LIST_PATTERN = re.compile(r"\?(?:\s*,\s*\?)+")
+VALUES_PATTERN = re.compile(r"(\(\?(?:\.\.\.)?\))(?:\s*,\s*\(\?(?:\.\.\.)?\))+")
+SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    파라미터 / 상수를 ? 로 바꾸고 IN 목록, 다중 VALUES를 하나로 묶어 같은 쿼리로 집계
+    - 예: WHERE id IN ($1, $2, $3) -> WHERE id IN (?...)
+    """
+
+    statement = SPACE_PATTERN.sub(" ", statement).strip()
+    statement = PARAM_PATTERN.sub("?", statement)
+    statement = PARAM_LIST_PATTERN.sub("?...", statement)
+    return VALUES_PATTERN.sub(r"\1, ...", statement)
+
+
+def find_caller() -> str | None:
+    """
+    쿼리를 실행한 애플리케이션 함수 (src.db 제외한 가장 가까운 src.* 함수)
+    - AsyncSession은 greenlet 안에서 실행되므로 부모 greenlet의 호출 스택까지 확인
+    """
+
+    frame = sys._getframe(1)
+    parent = getcurrent().parent
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("src.") and not module.startswith("src.db"):
+            return f"{module}.{frame.f_code.co_qualname}"
+
+        frame = frame.f_back
+        if frame is None and parent is not None:
+            frame, parent = parent.gr_frame, None
+
+    return None
+
+
+class StatementStats:
+    def __init__(self):
+        self.histogram = metrics.Histogram("", "", QUERY_BUCKETS)
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.callers = Counter()
+
+    def add(self, seconds: float, rows: int, caller: str | None) -> None:
+        self.histogram.observe(seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.rows += rows
+        self.callers[caller] += 1
+
+    def collect(self) -> dict:
+        histogram = self.histogram.collect()
+        return {
+            "count": histogram["count"],
+            "total_seconds": round(histogram["sum"], 6),
+            "mean_seconds": round(histogram["sum"] / max(histogram["count"], 1), 6),
+            "max_seconds": round(self.max_seconds, 6),
+            "rows": self.rows,
+            "callers": dict(self.callers.most_common(TOP_CALLERS)),
+            "buckets": histogram["buckets"],
+        }
+
+
+class QueryStats:
+    """정규화한 쿼리별 실행 시간 / 행 수 / 호출 함수 집계"""
+
+    def __init__(self, max_statements: int):
+        self.max_statements = max_statements
+        self.statements: dict[str, StatementStats] = {}
+        self.lock = threading.Lock()
+
+    def add(self, statement: str, seconds: float, rows: int, caller: str | None):
+        key = normalize_statement(statement)
+        with self.lock:
+            stats = self.statements.get(key)
+            if stats is None:
+                if len(self.statements) >= self.max_statements:
+                    key = OTHER_STATEMENT
+                stats = self.statements.setdefault(key, StatementStats())
+            stats.add(seconds, rows, caller)
+
+    def collect(self) -> list[dict]:
+        """총 실행 시간이 긴 순서"""
+
+        with self.lock:
+            items = [
+                {"statement": statement, **stats.collect()}
+                for statement, stats in self.statements.items()
+            ]
+        return sorted(items, key=lambda item: item["total_seconds"], reverse=True)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.statements.clear()
+
+
+query_stats = QueryStats(DB_QUERY_STATS_MAX)
+metrics.register_collector("db_queries", query_stats.collect)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - context._query_started_at
+    is_slow = DB_SLOW_QUERY_SECONDS and seconds >= DB_SLOW_QUERY_SECONDS
+    if not DB_QUERY_STATS and not is_slow:
+        return
+
+    rows = max(cursor.rowcount, 0) if cursor is not None else 0
+    caller = find_caller()
+
+    if DB_QUERY_STATS:
+        query_stats.add(statement, seconds, rows, caller)
+
+    if is_slow:
+        print(
+            f"[SLOW QUERY] {seconds:.3f}s rows={rows} caller={caller} "
+            f"db={conn.engine.url.host} {SPACE_PATTERN.sub(' ', statement)}"
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    엔진의 모든 SQL 실행 시간 측정 (비동기 엔진은 engine.sync_engine 전달)
+    - DB_QUERY_STATS: 쿼리별 집계, DB_SLOW_QUERY_SECONDS: 느린 쿼리 로그
+    - 파라미터 값은 기록하지 않음 (비밀번호 해시 등)
+    """
+
+    if not DB_QUERY_STATS and not DB_SLOW_QUERY_SECONDS:
+        return
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
@@ -0,0 +1,43 @@
+"""add video list index
+
+Revision ID: b3e9d4f6a210
+Revises: 7a0d5e3c1b98
+Create Date: 2026-10-18 20:41:07.352914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e9d4f6a210"
+down_revision: Union[str, None] = "7a0d5e3c1b98"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금 없이 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_videos_org_deleted_created",
+            "videos",
+            ["organization_id", "is_deleted", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_videos_org_deleted_created",
+            table_name="videos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""add plan renditions
+
+Revision ID: c5a8d0e4f217
+Revises: 9e3f2a61d8b4
+Create Date: 2026-10-18 15:21:09.604118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a8d0e4f217"
+down_revision: Union[str, None] = "9e3f2a61d8b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "organization_plans", sa.Column("renditions", sa.JSON(), nullable=True)
+    )
+
+    organization_plans = sa.table(
+        "organization_plans",
+        sa.column("name", sa.String),
+        sa.column("renditions", sa.JSON),
+    )
+    for name, renditions in [
+        ("TRIAL", ["480p", "360p"]),
+        ("PAID", ["1080p", "720p", "480p", "360p"]),
+    ]:
+        op.execute(
+            organization_plans.update()
+            .where(organization_plans.c.name == name)
+            .values(renditions=renditions)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("organization_plans", "renditions")
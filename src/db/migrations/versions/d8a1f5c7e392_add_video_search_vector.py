@@ -0,0 +1,95 @@
+"""add video search vector
+
+Revision ID: d8a1f5c7e392
+Revises: b3e9d4f6a210
+Create Date: 2026-10-18 21:15:42.806137
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a1f5c7e392"
+down_revision: Union[str, None] = "b3e9d4f6a210"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}description, '')), 'B')"
+)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (organization_id, search_vector) 복합 GIN 인덱스용
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    # 생성 컬럼(STORED)은 추가 시 테이블 재작성 + ACCESS EXCLUSIVE 잠금이 유지되므로
+    # 기본값 없는 컬럼 추가(메타데이터만 변경) 후 트리거로 유지
+    op.add_column(
+        "videos",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION videos_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER videos_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, description ON videos
+        FOR EACH ROW EXECUTE FUNCTION videos_search_vector_update()
+        """
+    )
+
+    # 트리거 생성 커밋 후 기존 영상은 id 구간별로 나눠 커밋 (행 잠금 시간 최소화)
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        max_id = conn.execute(sa.text("SELECT max(id) FROM videos")).scalar() or 0
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            conn.execute(
+                sa.text(
+                    f"UPDATE videos SET search_vector = {SEARCH_VECTOR_SQL.format(row='')} "
+                    "WHERE id > :start AND id <= :end AND search_vector IS NULL"
+                ),
+                {"start": start, "end": start + BACKFILL_BATCH_SIZE},
+            )
+
+        # 운영 중 테이블 잠금 없이 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)
+        op.create_index(
+            "ix_videos_org_search",
+            "videos",
+            ["organization_id", "search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_videos_org_search",
+            table_name="videos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS videos_search_vector_update ON videos")
+    op.execute("DROP FUNCTION IF EXISTS videos_search_vector_update()")
+    op.drop_column("videos", "search_vector")
@@ -0,0 +1,59 @@
+"""add partial indexes
+
+Revision ID: f4c2b7a9d016
+Revises: d8a1f5c7e392
+Create Date: 2026-10-18 21:52:19.470385
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c2b7a9d016"
+down_revision: Union[str, None] = "d8a1f5c7e392"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중 테이블 잠금 없이 생성 (CONCURRENTLY는 트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_organization_subscriptions_active_org",
+            "organization_subscriptions",
+            ["organization_id", "start_date"],
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_organization_subscriptions_active_end_date",
+            "organization_subscriptions",
+            ["end_date"],
+            unique=False,
+            postgresql_where=sa.text("is_active = true AND end_date IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_organization_subscriptions_active_end_date",
+            table_name="organization_subscriptions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_organization_subscriptions_active_org",
+            table_name="organization_subscriptions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
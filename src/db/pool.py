@@ -0,0 +1,100 @@
+import time
+import uuid
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from src.core import metrics
+from src.core.config import (
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_PGBOUNCER,
+)
+
+# 연결 획득 대기 시간 구간 (초)
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+
+
+def instrumented_pool_class(base: type[QueuePool], name: str) -> type[QueuePool]:
+    """
+    연결 풀 지표를 기록하는 QueuePool 하위 클래스 생성
+
+    - db_pool_{name}_checkout_seconds: 연결 획득 대기 시간 (새 연결 생성 포함)
+    - db_pool_{name}_in_use / _overflow: 사용 중 연결 수 / pool_size 초과 연결 수
+    - db_pool_{name}_overflow_total / _timeouts_total: 초과 연결 생성 / 대기 시간 초과 횟수
+    """
+
+    prefix = f"db_pool_{name}"
+    checkout_seconds = metrics.histogram(
+        f"{prefix}_checkout_seconds", "연결 획득 대기 시간", CHECKOUT_BUCKETS
+    )
+    in_use = metrics.gauge(f"{prefix}_in_use", "사용 중 연결 수")
+    overflow = metrics.gauge(f"{prefix}_overflow", "pool_size 초과 연결 수")
+    overflow_total = metrics.counter(
+        f"{prefix}_overflow_total", "pool_size 초과 연결 생성 횟수"
+    )
+    timeouts = metrics.counter(f"{prefix}_timeouts_total", "연결 대기 시간 초과 횟수")
+
+    class InstrumentedPool(base):
+        def connect(self):
+            started_at = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                timeouts.inc()
+                raise
+            finally:
+                checkout_seconds.observe(time.perf_counter() - started_at)
+
+            self.update_gauges()
+            return connection
+
+        def _do_return_conn(self, record) -> None:
+            super()._do_return_conn(record)
+            self.update_gauges()
+
+        def _inc_overflow(self) -> bool:
+            created = super()._inc_overflow()
+            if created and self._overflow > 0:
+                overflow_total.inc()
+            return created
+
+        def update_gauges(self) -> None:
+            in_use.set(self.checkedout())
+            overflow.set(max(self.overflow(), 0))
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def get_engine_options(name: str, pool_class: type[QueuePool]) -> dict:
+    """create_engine / create_async_engine 공통 연결 풀 옵션"""
+
+    return {
+        "poolclass": instrumented_pool_class(pool_class, name),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def get_asyncpg_connect_args() -> dict:
+    """
+    PgBouncer(transaction pooling) 호환 옵션
+    - 요청마다 다른 서버 연결을 쓸 수 있으므로 prepared statement 캐시 사용 안함
+    - 이름 충돌 방지를 위해 prepared statement 이름을 매번 새로 생성
+    """
+
+    if not DB_PGBOUNCER:
+        return {}
+
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
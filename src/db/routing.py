@@ -0,0 +1,151 @@
+import random
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Delete, Insert, Select, Update
+
+from src.core import metrics
+
+USE_PRIMARY = (
+    "use_primary"  # session.info 키, 쓰기 발생 후 True (이후 쿼리 모두 primary)
+)
+PRIMARY_READS = "primary_reads"  # session.info 키, primary_reads() 블록 안에서 True
+REPLICA = "replica"  # session.info 키, 세션에 고정된 replica
+
+replica_reads = metrics.counter("db_replica_reads_total", "replica로 보낸 읽기 쿼리 수")
+primary_fallbacks = metrics.counter(
+    "db_replica_fallback_total", "사용 가능한 replica가 없어 primary로 보낸 읽기 수"
+)
+primary_retries = metrics.counter(
+    "db_replica_retry_total", "replica 연결 끊김으로 primary에서 다시 실행한 읽기 수"
+)
+
+
+class ReplicaSet:
+    """
+    읽기 전용 replica 엔진 목록
+    - 연결 오류가 난 replica는 retry_after 초 동안 제외
+    """
+
+    def __init__(self, engines: list[AsyncEngine], retry_after: float):
+        self.engines = engines
+        self.retry_after = retry_after
+        self.down_until: dict[Engine, float] = {}
+
+        for engine in engines:
+            event.listen(engine.sync_engine, "handle_error", self.on_error)
+
+    def on_error(self, context) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.down_until[context.engine] = time.monotonic() + self.retry_after
+            print("[ERROR] replica 연결 오류, 일시 제외:", context.engine.url)
+
+    def is_down(self, engine: Engine) -> bool:
+        return self.down_until.get(engine, 0) > time.monotonic()
+
+    def choose(self) -> Engine | None:
+        now = time.monotonic()
+        available = [
+            engine.sync_engine
+            for engine in self.engines
+            if self.down_until.get(engine.sync_engine, 0) <= now
+        ]
+        return random.choice(available) if available else None
+
+
+def is_write(clause) -> bool:
+    """primary에서 실행해야 하는 쿼리 (쓰기, SELECT FOR UPDATE, 종류를 알 수 없는 쿼리)"""
+
+    if isinstance(clause, (Insert, Update, Delete)):
+        return True
+    if isinstance(clause, Select):
+        return clause._for_update_arg is not None
+    return True
+
+
+def make_routing_session(primary: AsyncEngine, replicas: ReplicaSet):
+    class RoutingSession(Session):
+        """
+        읽기 전용 쿼리는 replica, 나머지는 primary로 보내는 세션
+
+        - 세션(요청)마다 replica 하나를 고정하여 조회 결과의 시점을 일정하게 유지
+        - 쓰기가 한 번이라도 발생하면 이후 읽기도 primary (read-your-writes)
+        - 사용 가능한 replica가 없으면 primary
+        - replica 연결이 끊겨 읽기가 실패하면 primary에서 한 번 다시 실행
+          (세션에 불러온 객체가 없을 때만, 있으면 rollback 시 만료되므로 오류 그대로 발생)
+        """
+
+        last_bind: Engine | None = None
+
+        def execute(self, statement, *args, **kwargs):
+            try:
+                return super().execute(statement, *args, **kwargs)
+            except DBAPIError as e:
+                if not self.can_retry_on_primary(e):
+                    raise
+                print("[ERROR] replica 읽기 실패, primary에서 재실행:", e.orig)
+
+            # 끊긴 replica 연결을 트랜잭션에서 정리 (불러온 객체가 없어 만료될 것도 없음)
+            self.rollback()
+            primary_retries.inc()
+            with primary_reads(self):
+                return super().execute(statement, *args, **kwargs)
+
+        def can_retry_on_primary(self, error: DBAPIError) -> bool:
+            # 연결 끊김 / 연결 실패는 ReplicaSet.on_error에서 해당 replica를 제외함
+            return (
+                self.last_bind is not None
+                and self.last_bind is not primary.sync_engine
+                and (error.connection_invalidated or replicas.is_down(self.last_bind))
+                and not self.identity_map
+                and not self.new
+                and not self.deleted
+            )
+
+        def get_bind(self, mapper=None, clause=None, **kw):
+            self.last_bind = self.choose_bind(clause)
+            return self.last_bind
+
+        def choose_bind(self, clause=None) -> Engine:
+            if self._flushing or is_write(clause):
+                self.info[USE_PRIMARY] = True
+
+            if (
+                self.info.get(USE_PRIMARY)
+                or self.info.get(PRIMARY_READS)
+                or not replicas.engines
+            ):
+                return primary.sync_engine
+
+            replica = self.info.get(REPLICA)
+            if replica is None or replicas.is_down(replica):
+                replica = self.info[REPLICA] = replicas.choose()
+
+            if replica is None:
+                primary_fallbacks.inc()
+                return primary.sync_engine
+
+            replica_reads.inc()
+            return replica
+
+    return RoutingSession
+
+
+@contextmanager
+def primary_reads(db: AsyncSession | Session):
+    """
+    블록 안의 읽기를 primary로 실행 (복제 지연 없이 최신 데이터가 필요한 조회)
+    - 캐시에 저장할 데이터 조회 등, 오래된 값이 캐시 TTL 동안 남으면 안 되는 경우
+    """
+
+    previous = db.info.get(PRIMARY_READS, False)
+    db.info[PRIMARY_READS] = True
+    try:
+        yield
+    finally:
+        db.info[PRIMARY_READS] = previous
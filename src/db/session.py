@@ -1,11 +1,40 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from src.core.config import DATABASE_URL
-
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from src.core.config import (
+    DATABASE_URL,
+    DB_ECHO,
+    READ_REPLICA_URLS,
+    READ_REPLICA_RETRY_SECONDS,
+)
+from src.db.instrumentation import instrument_engine
+from src.db.pool import get_engine_options, get_asyncpg_connect_args
+from src.db.routing import ReplicaSet, make_routing_session
 
 # 비동기 db 연결
-async_engine = create_async_engine(DATABASE_URL, echo=True)
+async_engine = create_async_engine(
+    DATABASE_URL,
+    echo=DB_ECHO,
+    connect_args=get_asyncpg_connect_args(),
+    **get_engine_options("async", AsyncAdaptedQueuePool),
+)
+
+# 읽기 전용 replica (READ_REPLICA_URLS 설정 시)
+replica_engines = [
+    create_async_engine(
+        url,
+        echo=DB_ECHO,
+        connect_args=get_asyncpg_connect_args(),
+        **get_engine_options(f"replica{index}", AsyncAdaptedQueuePool),
+    )
+    for index, url in enumerate(READ_REPLICA_URLS, start=1)
+]
+for engine in [async_engine, *replica_engines]:
+    instrument_engine(engine.sync_engine)
+replica_set = ReplicaSet(replica_engines, retry_after=READ_REPLICA_RETRY_SECONDS)
+
 async_session = async_sessionmaker(
     bind=async_engine,
+    sync_session_class=make_routing_session(async_engine, replica_set),
     autocommit=False,
     autoflush=False,
     class_=AsyncSession,
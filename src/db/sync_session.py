@@ -1,8 +1,15 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from src.core.config import SYNC_DATABASE_URL
+from sqlalchemy.pool import QueuePool
+from src.core.config import SYNC_DATABASE_URL, DB_ECHO
+from src.db.instrumentation import instrument_engine
+from src.db.pool import get_engine_options
 
-sync_engine = create_engine(SYNC_DATABASE_URL, echo=True)
+# psycopg2는 서버 prepared statement를 쓰지 않으므로 PgBouncer 별도 옵션 불필요
+sync_engine = create_engine(
+    SYNC_DATABASE_URL, echo=DB_ECHO, **get_engine_options("sync", QueuePool)
+)
+instrument_engine(sync_engine)
 sync_session = sessionmaker(
     bind=sync_engine,
     autocommit=False,
@@ -1,4 +1,7 @@
-from fastapi import FastAPI, Request
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from src.swagger import custom_openapi
@@ -9,9 +12,26 @@ from src.user.routers import (
 )
 from src.organization.routers import router as organization_router
 from src.video.routers import router as video_router, admin_router as admin_video_router
+from src.organization.entitlements import listen_entitlement_invalidation
+from src.auth.cache import listen_user_invalidation
+from src.auth.permissions import operator_required
 from src.core.exceptions import AppBaseException
+from src.core.metrics import collect_metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 기업 플랜 권한 / 로그인 유저 캐시 무효화 메시지 구독
+    listeners = [
+        asyncio.create_task(listen_entitlement_invalidation()),
+        asyncio.create_task(listen_user_invalidation()),
+    ]
+    yield
+    for listener in listeners:
+        listener.cancel()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 all_routers = [
     auth_router,
@@ -32,9 +52,23 @@ async def handle_custom_exceptions(request: Request, exc: AppBaseException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"message": exc.detail},
+        headers=exc.headers,
     )
 
 
 @app.get("/")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get(
+    "/internal/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(operator_required)],
+)
+async def read_metrics():
+    """
+    현재 API 서버 프로세스의 지표 (비밀번호 해시 풀 대기 / 실행 시간 등)
+    - 운영자만 조회 가능 (X-Operator-Token 헤더, OPERATOR_TOKEN)
+    """
+    return collect_metrics()
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.db.routing import primary_reads
+from src.core.config import (
+    REDIS_CLIENT,
+    SYNC_REDIS_CLIENT,
+    ENTITLEMENT_CACHE_TTL,
+    ENTITLEMENT_CACHE_MAXSIZE,
+)
+from src.organization import repository as org_repo
+
+ENTITLEMENT_CHANNEL = "entitlement:invalidate"  # 메시지: organization_id
+RESUBSCRIBE_DELAY = 1  # 초, Redis 연결 끊김 시 재구독 대기
+
+entitlement_cache = TTLCache(
+    maxsize=ENTITLEMENT_CACHE_MAXSIZE, ttl=ENTITLEMENT_CACHE_TTL
+)
+
+
+class Entitlement(BaseModel):
+    """기업이 현재 구독 중인 플랜의 권한"""
+
+    organization_id: int
+    plan_name: str | None = None  # 활성 구독이 없으면 None
+    price: int = 0
+    recoverable: bool = False
+    renditions: list[str] | None = None  # Null이면 기본값
+    end_date: datetime | None = None  # Null이면 만료 없음
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        return self.end_date is not None and self.end_date <= (now or datetime.now())
+
+    @property
+    def is_paid(self) -> bool:
+        """
+        유료 플랜 이용 여부
+        - 복구 가능 플랜이고 만료일이 지나지 않음 (만료 작업 실행 전이어도 False)
+        """
+        return self.recoverable and not self.is_expired()
+
+
+async def load_entitlement(db: AsyncSession, organization_id: int) -> Entitlement:
+    # 구독 변경 직후 무효화되므로 복제 지연된 값을 캐시하지 않도록 primary 조회
+    with primary_reads(db):
+        subscription = await org_repo.get_active_subscription(db, organization_id)
+    if subscription is None:
+        return Entitlement(organization_id=organization_id)
+
+    plan = subscription.plan
+    return Entitlement(
+        organization_id=organization_id,
+        plan_name=plan.name,
+        price=plan.price or 0,
+        recoverable=bool(plan.recoverable),
+        renditions=plan.renditions,
+        end_date=subscription.end_date,
+    )
+
+
+def get_cache_ttl(entitlement: Entitlement) -> float | None:
+    """만료일 전이면 만료 시각까지만 캐시 (pub/sub 메시지 유실 대비)"""
+
+    if entitlement.end_date is None or entitlement.is_expired():
+        return None
+    return (entitlement.end_date - datetime.now()).total_seconds()
+
+
+async def get_entitlement(db: AsyncSession, organization_id: int) -> Entitlement:
+    """기업 플랜 권한 조회 - 프로세스 캐시, 없으면 DB 조회 후 캐시"""
+
+    entitlement = entitlement_cache.get(organization_id)
+    if entitlement is None:
+        entitlement = await load_entitlement(db, organization_id)
+        entitlement_cache.set(
+            organization_id, entitlement, ttl=get_cache_ttl(entitlement)
+        )
+    return entitlement
+
+
+async def invalidate_entitlement(organization_id: int) -> None:
+    """구독 변경 시 호출 - 모든 API 서버의 캐시 무효화"""
+
+    entitlement_cache.delete(organization_id)
+    try:
+        await REDIS_CLIENT.publish(ENTITLEMENT_CHANNEL, organization_id)
+    except RedisError as e:
+        print("[ERROR]", e)
+
+
+def invalidate_entitlements_sync(organization_ids: list[int]) -> None:
+    """celery 작업용 - 무효화 메시지만 발행"""
+
+    if not organization_ids:
+        return
+
+    try:
+        with SYNC_REDIS_CLIENT.pipeline(transaction=False) as pipe:
+            for org_id in organization_ids:
+                pipe.publish(ENTITLEMENT_CHANNEL, org_id)
+            pipe.execute()
+    except RedisError as e:
+        print("[ERROR]", e)
+
+
+async def listen_entitlement_invalidation() -> None:
+    """
+    무효화 메시지 구독 (API 서버 시작 시 백그라운드 실행)
+    - 연결이 끊기면 그동안의 메시지를 놓쳤을 수 있으므로 캐시 전체 삭제 후 재구독
+    """
+
+    while True:
+        pubsub = REDIS_CLIENT.pubsub()
+        try:
+            await pubsub.subscribe(ENTITLEMENT_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message" and message["data"].isdigit():
+                    entitlement_cache.delete(int(message["data"]))
+        except RedisError as e:
+            print("[ERROR]", e)
+        finally:
+            await pubsub.aclose()
+
+        entitlement_cache.clear()
+        await asyncio.sleep(RESUBSCRIBE_DELAY)
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from redis.exceptions import RedisError
+
+from src.core.config import REDIS_CLIENT, SYNC_REDIS_CLIENT
+
+# sorted set, subscription_id -> 만료 시각(end_date timestamp)
+EXPIRY_QUEUE_KEY = "subscription:expiry"
+EXPIRY_LOCK_KEY = "subscription:expiry:lock"
+
+
+async def schedule_expiry(subscription_id: int, end_date: datetime) -> None:
+    """
+    구독 만료 예약 (expire_due_subscriptions 작업이 만료 시각에 처리)
+    - Redis 오류 시 로그만 남김 (일일 만료 작업에서 처리)
+    """
+
+    try:
+        await REDIS_CLIENT.zadd(
+            EXPIRY_QUEUE_KEY, {str(subscription_id): end_date.timestamp()}
+        )
+    except RedisError as e:
+        print("[ERROR] 구독 만료 예약 실패:", subscription_id, e)
+
+
+def schedule_expiries_sync(subscriptions: list[tuple[int, datetime]]) -> None:
+    """celery 작업용 - (subscription_id, end_date) 목록 만료 예약 (이미 있으면 갱신)"""
+
+    if subscriptions:
+        SYNC_REDIS_CLIENT.zadd(
+            EXPIRY_QUEUE_KEY,
+            {str(sub_id): end_date.timestamp() for sub_id, end_date in subscriptions},
+        )
+
+
+def get_due_expiries_sync(now: datetime, limit: int, offset: int = 0) -> list[int]:
+    """만료 시각이 지난 구독 ID (만료 시각 순, 앞의 offset건 제외)"""
+
+    members = SYNC_REDIS_CLIENT.zrangebyscore(
+        EXPIRY_QUEUE_KEY, "-inf", now.timestamp(), start=offset, num=limit
+    )
+    return [int(member) for member in members]
+
+
+def remove_expiries_sync(subscription_ids: list[int]) -> None:
+    if subscription_ids:
+        SYNC_REDIS_CLIENT.zrem(EXPIRY_QUEUE_KEY, *map(str, subscription_ids))
@@ -8,6 +8,9 @@ from sqlalchemy import (
     Boolean,
     Text,
     ForeignKey,
+    JSON,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -32,10 +35,31 @@ class OrganizationPlan(Base, TimestampModel):
         Integer, nullable=True, doc="플랜 구독 기간(day(일) 단위), Null이면 무료 플랜"
     )
     recoverable = Column(Boolean, default=False, doc="삭제 영상 복구 여부")
+    renditions = Column(
+        JSON,
+        nullable=True,
+        doc='ABR 변환 화질 목록 (예: ["720p", "480p"]), Null이면 기본값',
+    )
 
 
 class OrganizationSubscription(Base, TimestampModel):
     __tablename__ = "organization_subscriptions"
+    __table_args__ = (
+        # 활성 구독만 색인 (만료된 구독은 계속 쌓이지만 조회 대상 아님)
+        # 조회 조건은 is_active == True로 작성 (IS TRUE는 인덱스 조건으로 증명되지 않을 수 있음)
+        Index(
+            "ix_organization_subscriptions_active_org",
+            "organization_id",
+            "start_date",
+            postgresql_where=text("is_active = true"),
+        ),
+        # 만료 작업 대상 조회
+        Index(
+            "ix_organization_subscriptions_active_end_date",
+            "end_date",
+            postgresql_where=text("is_active = true AND end_date IS NOT NULL"),
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     organization_id = Column(BigInteger, ForeignKey("organizations.id"), nullable=False)
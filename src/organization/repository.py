@@ -1,6 +1,7 @@
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, and_
+from sqlalchemy.orm import joinedload
 
 from src.organization import exceptions
 from src.organization.models import (
@@ -70,31 +71,29 @@ async def expire_subscription(db: AsyncSession, org_id: int):
         update(OrganizationSubscription)
         .where(
             OrganizationSubscription.organization_id == org_id,
-            OrganizationSubscription.is_active.is_(True),
+            OrganizationSubscription.is_active == True,
         )
         .values(is_active=False, end_date=datetime.now())
     )
     await db.execute(stmt.execution_options(synchronize_session="fetch"))
 
 
-async def is_paid_plan(db: AsyncSession, organization_id) -> bool:
-    """
-    유료 플랜 이용 여부 판별
-    - 현재 활성화된 구독이 있고
-    - 해당 플랜의 복구 가능이 true
-    """
+async def get_active_subscription(
+    db: AsyncSession, organization_id: int
+) -> OrganizationSubscription | None:
+    """현재 활성화된 구독 조회 (플랜 포함)"""
+
     stmt = (
         select(OrganizationSubscription)
-        .join(OrganizationSubscription.plan)
+        .options(joinedload(OrganizationSubscription.plan))
         .where(
             and_(
                 OrganizationSubscription.organization_id == organization_id,
-                OrganizationSubscription.is_active.is_(True),
-                OrganizationPlan.recoverable.is_(True),
+                OrganizationSubscription.is_active == True,
             )
         )
+        .order_by(OrganizationSubscription.start_date.desc())
+        .limit(1)
     )
     query = await db.execute(stmt)
-    subscription = query.scalar()
-
-    return subscription is not None
+    return query.scalar_one_or_none()
@@ -4,6 +4,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from src.db.session import get_transaction_db
 from src.organization.schemas import OrganizationCreate, PlanType
 from src.organization import exceptions
+from src.organization.entitlements import invalidate_entitlement
+from src.organization.expiry import schedule_expiry
 
 from src.organization import repository as org_repo
 from src.user.repository import create_admin_user
@@ -61,7 +63,11 @@ async def switch_to_paid_plan(
             )
             print("*" * 10, type(new_sub), new_sub)
             print(new_sub.start_date, new_sub.end_date)
-            return new_sub
 
     except SQLAlchemyError:
         raise exceptions.SubscriptionCreateFailed
+
+    await invalidate_entitlement(org_id)
+    if new_sub.end_date:
+        await schedule_expiry(new_sub.id, new_sub.end_date)
+    return new_sub
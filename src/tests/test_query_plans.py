@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.core.config import SYNC_DATABASE_URL
+from src.organization import repository as org_repo
+from src.user import repository as user_repo
+from src.video import repository as video_repo
+
+# 마이그레이션 적용된 DB에서 실행 (EXPLAIN만 실행, 데이터 변경 없음), DB가 없으면 skip
+# 테스트 DB는 데이터가 적어 순차 스캔이 선택되므로 enable_seqscan=off로 인덱스 사용 가능 여부 확인
+
+
+class CaptureSession:
+    """repository 함수가 실행하는 쿼리 수집 (DB 실행 없음)"""
+
+    def __init__(self):
+        self.info = {}
+        self.statements = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return EmptyResult()
+
+
+class EmptyResult:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def capture(func, *args, **kwargs):
+    db = CaptureSession()
+    asyncio.run(func(db, *args, **kwargs))
+    return db.statements[0]
+
+
+def expire_sweep_stmt():
+    """만료 작업 쿼리 (celery expire_subscription_batch)"""
+
+    from src.core.celery.tasks.organization import make_expire_stmt
+
+    return make_expire_stmt(datetime.now(), 1000)
+
+
+CASES = [
+    (
+        "organization.get_active_subscription",
+        lambda: capture(org_repo.get_active_subscription, 1),
+        "ix_organization_subscriptions_active_org",
+    ),
+    (
+        "organization.expire_subscription",
+        lambda: capture(org_repo.expire_subscription, 1),
+        "ix_organization_subscriptions_active_org",
+    ),
+    (
+        "celery.expire_subscription_batch",
+        expire_sweep_stmt,
+        "ix_organization_subscriptions_active_end_date",
+    ),
+    (
+        "user.get_user",
+        lambda: capture(user_repo.get_user, 1),
+        "users_pkey",
+    ),
+    (
+        "user.get_active_user_by_email_and_org",
+        lambda: capture(user_repo.get_active_user_by_email_and_org, "a@a.com", 1),
+        "unique_organization_email",
+    ),
+    (
+        "video.get_video_by_id",
+        lambda: capture(video_repo.get_video_by_id, 1),
+        "videos_pkey",
+    ),
+    (
+        "video.get_videos_page",
+        lambda: capture(video_repo.get_videos_page, 1, 20, cursor=(datetime.now(), 1)),
+        "ix_videos_org_deleted_created",
+    ),
+    (
+        "video.search_videos",
+        lambda: capture(video_repo.search_videos, 1, "video:*", 20),
+        "ix_videos_org_search",
+    ),
+]
+
+
+def find_index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= find_index_names(child)
+    return names
+
+
+def explain(conn, stmt) -> dict:
+    compiled = stmt.compile(dialect=conn.dialect)
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    return result.scalar()[0]["Plan"]
+
+
+@pytest.fixture(scope="module")
+def conn():
+    if not SYNC_DATABASE_URL:
+        pytest.skip("SYNC_DATABASE_URL 미설정")
+
+    from src.db.sync_session import sync_engine
+
+    try:
+        connection = sync_engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"DB 연결 실패: {e}")
+
+    with connection, connection.begin():
+        if (
+            connection.exec_driver_sql("SELECT to_regclass('alembic_version')").scalar()
+            is None
+        ):
+            pytest.skip("마이그레이션이 적용되지 않은 DB")
+
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        yield connection
+
+
+@pytest.mark.parametrize(
+    "make_stmt, index_name",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_query_uses_index(conn, make_stmt, index_name):
+    index_names = find_index_names(explain(conn, make_stmt()))
+
+    assert index_name in index_names, f"사용한 인덱스: {sorted(index_names)}"
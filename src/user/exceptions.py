@@ -4,6 +4,7 @@ from src.core.exceptions import (
     ForbiddenException,
     NotFoundException,
     DuplicateDataException,
+    InternalServerErrorException,
 )
 
 
@@ -28,3 +29,39 @@ class AddPointException(AppBaseException):
             detail="잠시 후 다시 시도하세요.",
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         )
+
+
+class LeaderboardUnavailableException(InternalServerErrorException):
+    def __init__(self):
+        super().__init__("포인트 순위를 조회할 수 없습니다.")
+
+
+class UnsupportedImportFormatException(AppBaseException):
+    def __init__(self):
+        super().__init__(
+            detail="지원하지 않는 형식입니다. (text/csv, application/x-ndjson)",
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
+
+
+class InvalidImportHeaderException(AppBaseException):
+    def __init__(self):
+        super().__init__("CSV 첫 줄에 email 컬럼이 필요합니다.")
+
+
+class ImportTooLargeException(AppBaseException):
+    def __init__(self):
+        super().__init__(
+            detail="일괄 등록 파일 크기가 너무 큽니다.",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+
+class ImportJobNotFoundException(NotFoundException):
+    def __init__(self):
+        super().__init__("존재하지 않는 일괄 등록 작업입니다.")
+
+
+class UserImportFailedException(InternalServerErrorException):
+    def __init__(self):
+        super().__init__("유저 일괄 등록 중 오류가 발생했습니다.")
@@ -0,0 +1,257 @@
+import csv
+import json
+import os
+import uuid
+from typing import AsyncIterator
+
+import aiofiles as aio
+from pydantic import ValidationError
+
+from src.core.config import (
+    REDIS_CLIENT,
+    SYNC_REDIS_CLIENT,
+    TEMP_UPLOAD_DIR,
+    USER_IMPORT_BATCH_SIZE,
+    USER_IMPORT_MAX_SIZE,
+    USER_IMPORT_MAX_ERRORS,
+    USER_IMPORT_JOB_TTL,
+)
+from src.user import exceptions as user_exceptions
+from src.user.schemas import UserCreate, UserImportError, UserImportResult
+
+JOB_KEY = "user:import:{job_id}"
+INT_FIELDS = ("organization_id", "total", "created", "failed")
+
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-lines": "ndjson",
+}
+
+DUPLICATE_IN_FILE = "파일 내 중복된 이메일입니다."
+DUPLICATE_EMAIL = "이미 존재하는 이메일입니다."
+
+
+def get_import_format(content_type: str | None) -> str:
+    """Content-Type -> csv | ndjson"""
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_FORMATS:
+        raise user_exceptions.UnsupportedImportFormatException
+    return IMPORT_FORMATS[media_type]
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    요청 body를 한 줄씩 반환 (전체를 메모리에 올리지 않음)
+    - USER_IMPORT_MAX_SIZE 초과 시 ImportTooLargeException
+    """
+
+    buffer = b""
+    size = 0
+    first = True
+    async for chunk in stream:
+        size += len(chunk)
+        if size > USER_IMPORT_MAX_SIZE:
+            raise user_exceptions.ImportTooLargeException
+
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig" if first else "utf-8", errors="replace")
+            first = False
+
+    if buffer:
+        yield buffer.decode("utf-8-sig" if first else "utf-8", errors="replace")
+
+
+class UserImporter:
+    """
+    일괄 등록 행 파싱 및 결과 집계 (API / celery 공용)
+
+    - CSV: 첫 줄은 헤더 (email, password), NDJSON: 한 줄에 JSON 객체 하나
+    - 비밀번호가 없으면 이메일을 초기 비밀번호로 사용 (단건 생성과 동일)
+    - 유효한 행은 batch로 모으고, 오류 행은 결과에 기록
+    """
+
+    def __init__(self, fmt: str, batch_size: int = USER_IMPORT_BATCH_SIZE):
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.header: list[str] | None = None
+        self.line_no = 0
+        self.seen: set[str] = set()
+        self.batch: list[tuple[int, UserCreate]] = []
+        self.result = UserImportResult()
+
+    def parse(self, line: str) -> dict | None:
+        if self.fmt == "csv":
+            values = next(csv.reader([line]))
+            if self.header is None:
+                self.header = [value.strip().lower() for value in values]
+                if "email" not in self.header:
+                    raise user_exceptions.InvalidImportHeaderException
+                return None
+            return dict(zip(self.header, values))
+
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError("JSON 객체가 아닙니다.")
+        return data
+
+    def add_line(self, line: str) -> bool:
+        """
+        한 줄 처리
+
+        :return bool: batch가 가득 찼으면 True (저장 필요)
+        """
+
+        self.line_no += 1
+        line = line.strip()
+        if not line:
+            return False
+
+        try:
+            data = self.parse(line)
+        except ValueError:
+            self.result.total += 1
+            self.add_error(self.line_no, None, "형식이 올바르지 않습니다.")
+            return False
+        if data is None:
+            return False
+
+        self.result.total += 1
+        values = {
+            field: str(data[field]).strip()
+            for field in ("email", "password")
+            if data.get(field) not in (None, "")
+        }
+        try:
+            user = UserCreate(**values)
+        except ValidationError as e:
+            self.add_error(self.line_no, values.get("email"), e.errors()[0]["msg"])
+            return False
+
+        if user.email in self.seen:
+            self.add_error(self.line_no, user.email, DUPLICATE_IN_FILE)
+            return False
+        self.seen.add(user.email)
+
+        if user.password is None:
+            user.password = user.email
+        self.batch.append((self.line_no, user))
+        return len(self.batch) >= self.batch_size
+
+    def add_error(self, line: int, email: str | None, reason: str) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < USER_IMPORT_MAX_ERRORS:
+            self.result.errors.append(
+                UserImportError(line=line, email=email, reason=reason)
+            )
+
+    def take_batch(self) -> list[tuple[int, UserCreate]]:
+        batch, self.batch = self.batch, []
+        return batch
+
+    def record_batch(
+        self, batch: list[tuple[int, UserCreate]], created: set[str]
+    ) -> None:
+        """저장 결과 반영 - 생성되지 않은 행은 중복 이메일"""
+
+        for line, user in batch:
+            if user.email in created:
+                self.result.created += 1
+            else:
+                self.add_error(line, user.email, DUPLICATE_EMAIL)
+
+
+def make_import_rows(
+    org_id: int, batch: list[tuple[int, UserCreate]], hashed_passwords: list[str]
+) -> list[dict]:
+    return [
+        {
+            "organization_id": org_id,
+            "email": user.email,
+            "hashed_password": hashed_password,
+        }
+        for (_, user), hashed_password in zip(batch, hashed_passwords)
+    ]
+
+
+async def save_import_file(stream: AsyncIterator[bytes]) -> str:
+    """celery 작업용 임시 파일 저장 (USER_IMPORT_MAX_SIZE 제한)"""
+
+    os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
+    tmp_path = os.path.join(TEMP_UPLOAD_DIR, f"{uuid.uuid4().hex}_users")
+    size = 0
+    try:
+        async with aio.open(tmp_path, "wb") as out_file:
+            async for chunk in stream:
+                size += len(chunk)
+                if size > USER_IMPORT_MAX_SIZE:
+                    raise user_exceptions.ImportTooLargeException
+                await out_file.write(chunk)
+
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return tmp_path
+
+
+async def create_import_job(organization_id: int) -> str:
+    """일괄 등록 작업 상태 생성 (Redis hash)"""
+
+    job_id = uuid.uuid4().hex
+    key = JOB_KEY.format(job_id=job_id)
+    async with REDIS_CLIENT.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            key,
+            mapping={
+                "organization_id": organization_id,
+                "status": "PENDING",
+                "total": 0,
+                "created": 0,
+                "failed": 0,
+            },
+        )
+        pipe.expire(key, USER_IMPORT_JOB_TTL)
+        await pipe.execute()
+
+    return job_id
+
+
+async def get_import_job(job_id: str) -> dict | None:
+    job = await REDIS_CLIENT.hgetall(JOB_KEY.format(job_id=job_id))
+    if not job:
+        return None
+
+    for field in INT_FIELDS:
+        job[field] = int(job[field])
+    job["errors"] = json.loads(job.get("errors", "[]"))
+
+    return job
+
+
+def update_import_job_sync(
+    job_id: str, status: str, result: UserImportResult, finished: bool = False
+) -> None:
+    """celery 작업 진행 상태 갱신 - 실패 행 목록은 작업 종료 시에만 저장"""
+
+    mapping = {
+        "status": status,
+        "total": result.total,
+        "created": result.created,
+        "failed": result.failed,
+    }
+    if finished:
+        mapping["errors"] = json.dumps(
+            [error.model_dump() for error in result.errors], ensure_ascii=False
+        )
+
+    key = JOB_KEY.format(job_id=job_id)
+    with SYNC_REDIS_CLIENT.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, USER_IMPORT_JOB_TTL)
+        pipe.execute()
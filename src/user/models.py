@@ -39,24 +39,46 @@ class User(Base, TimestampModel):
 
     def set_password(self, raw_password: str):
         """비밀번호 암호화"""
-        from src.auth.serivce import hash_password
+        from src.auth.hashing import hash_password
 
         self.hashed_password = hash_password(raw_password)
 
     def verify_password(self, raw_password: str) -> bool:
         """비밀번호 검증"""
-        from src.auth.serivce import verify_password
+        from src.auth.hashing import verify_password
 
         return verify_password(raw_password, self.hashed_password)
 
 
 class UserVideoPoint(Base, TimestampModel):
     __tablename__ = "user_video_points"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "video_id", "bucket", name="unique_user_video_point_bucket"
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
     video_id = Column(BigInteger, ForeignKey("videos.id"), nullable=False, index=True)
     point = Column(Integer, nullable=False, default=10, doc="포인트")
+    bucket = Column(
+        BigInteger,
+        nullable=True,
+        doc="중복 적립 방지 시간 구간 (POINT_DEDUP_WINDOW 단위), Null이면 중복 확인 안함",
+    )
 
     user = relationship("User", backref="points")
     video = relationship("Video", backref="points")
+
+
+class UserPointBalance(Base, TimestampModel):
+    """유저 포인트 합계 - 포인트 적립 시 함께 갱신"""
+
+    __tablename__ = "user_point_balances"
+
+    user_id = Column(BigInteger, ForeignKey("users.id"), primary_key=True)
+    organization_id = Column(
+        BigInteger, ForeignKey("organizations.id"), nullable=False, index=True
+    )
+    balance = Column(BigInteger, nullable=False, default=0, doc="포인트 합계")
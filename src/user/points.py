@@ -0,0 +1,191 @@
+import json
+import time
+import uuid
+from datetime import datetime
+
+from src.core.config import REDIS_CLIENT, SYNC_REDIS_CLIENT, POINT_DEDUP_WINDOW
+
+DEDUP_KEY = "point:dedup:{user_id}:{video_id}"
+QUEUE_KEY = "point:queue"
+PROCESSING_KEY = "point:processing:{batch_id}"  # list, DB 저장 중인 적립 내역
+PROCESSING_BATCHES_KEY = "point:processing"  # sorted set, batch_id -> 가져간 시각
+FLUSH_LOCK_KEY = "point:flush:lock"
+LEADERBOARD_KEY = "leaderboard:org:{organization_id}"  # sorted set, user_id -> balance
+LEADERBOARD_READY_KEY = "leaderboard:org:{organization_id}:ready"  # 재생성 완료 표시
+
+# 중복 확인 + 적재를 한 번의 Redis 호출로 원자적으로 처리
+BUFFER_POINT_SCRIPT = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    redis.call('RPUSH', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+buffer_point_script = REDIS_CLIENT.register_script(BUFFER_POINT_SCRIPT)
+
+# 큐 앞쪽 내역을 batch 전용 list로 옮겨서 가져감 (동시에 실행된 작업과 같은 내역을 나누지 않음)
+CLAIM_POINTS_SCRIPT = """
+local entries = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #entries > 0 then
+    redis.call('LTRIM', KEYS[1], #entries, -1)
+    redis.call('RPUSH', KEYS[2], unpack(entries))
+    redis.call('ZADD', KEYS[3], ARGV[3], ARGV[2])
+end
+return entries
+"""
+claim_points_script = SYNC_REDIS_CLIENT.register_script(CLAIM_POINTS_SCRIPT)
+
+
+# 재생성한 순위표로 교체 - 기존 순위표의 더 큰 점수(재생성 중 적립)는 유지
+REPLACE_LEADERBOARD_SCRIPT = """
+local current = redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+for i = 1, #current, 2 do
+    redis.call('ZADD', KEYS[2], 'GT', current[i + 1], current[i])
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('RENAME', KEYS[2], KEYS[1])
+end
+redis.call('SET', KEYS[3], 1)
+return 1
+"""
+replace_leaderboard_script = REDIS_CLIENT.register_script(REPLACE_LEADERBOARD_SCRIPT)
+
+
+def get_point_bucket(at: datetime) -> int:
+    """중복 적립 방지 시간 구간 - 같은 구간의 같은 영상 조회는 한 번만 적립"""
+    return int(at.timestamp()) // POINT_DEDUP_WINDOW
+
+
+async def buffer_user_video_point(user_id: int, video_id: int) -> bool:
+    """
+    포인트 적립 요청을 Redis 큐에 적재 (DB 저장은 flush_buffered_points 작업)
+
+    :return bool: 적재 여부, POINT_DEDUP_WINDOW 내 같은 영상 재조회면 False
+    """
+
+    entry = json.dumps(
+        {
+            "user_id": user_id,
+            "video_id": video_id,
+            "created_at": datetime.now().isoformat(),
+        }
+    )
+    result = await buffer_point_script(
+        keys=[
+            DEDUP_KEY.format(user_id=user_id, video_id=video_id),
+            QUEUE_KEY,
+        ],
+        args=[POINT_DEDUP_WINDOW, entry],
+    )
+    return bool(result)
+
+
+def claim_point_batch_sync(batch_size: int) -> tuple[str, list[str]]:
+    """
+    celery 작업용 - 큐 앞쪽 batch_size건을 가져감
+    - DB 저장 후 finish_point_batch_sync로 삭제, 실패 시 get_stale_point_batches_sync로 재처리
+    :return: (batch_id, 적립 내역 목록)
+    """
+
+    batch_id = uuid.uuid4().hex
+    entries = claim_points_script(
+        keys=[
+            QUEUE_KEY,
+            PROCESSING_KEY.format(batch_id=batch_id),
+            PROCESSING_BATCHES_KEY,
+        ],
+        args=[batch_size, batch_id, time.time()],
+    )
+    return batch_id, entries
+
+
+def get_point_batch_sync(batch_id: str) -> list[str]:
+    return SYNC_REDIS_CLIENT.lrange(PROCESSING_KEY.format(batch_id=batch_id), 0, -1)
+
+
+def get_stale_point_batches_sync(older_than: float) -> list[str]:
+    """older_than초 전에 가져간 뒤 삭제되지 않은 batch (저장 실패, 작업 중단)"""
+
+    return SYNC_REDIS_CLIENT.zrangebyscore(
+        PROCESSING_BATCHES_KEY, "-inf", time.time() - older_than
+    )
+
+
+def finish_point_batch_sync(batch_id: str) -> None:
+    with SYNC_REDIS_CLIENT.pipeline(transaction=True) as pipe:
+        pipe.delete(PROCESSING_KEY.format(batch_id=batch_id))
+        pipe.zrem(PROCESSING_BATCHES_KEY, batch_id)
+        pipe.execute()
+
+
+def invalidate_leaderboards_sync(organization_ids: list[int]) -> None:
+    """celery 작업용 - 재생성 완료 표시 삭제 (다음 조회 시 DB 합계로 재생성)"""
+
+    if organization_ids:
+        SYNC_REDIS_CLIENT.delete(
+            *[
+                LEADERBOARD_READY_KEY.format(organization_id=org_id)
+                for org_id in organization_ids
+            ]
+        )
+
+
+async def update_leaderboard(organization_id: int, user_id: int, balance: int) -> None:
+    """
+    순위표 점수 갱신 - 누적값이 아닌 DB 합계로 덮어써서 재시도해도 안전
+    - 합계는 증가만 하므로 GT: 동시 적립 시 나중에 도착한 이전(작은) 합계는 무시
+    """
+    key = LEADERBOARD_KEY.format(organization_id=organization_id)
+    await REDIS_CLIENT.zadd(key, {str(user_id): balance}, gt=True)
+
+
+async def remove_from_leaderboard(organization_id: int, user_id: int) -> None:
+    key = LEADERBOARD_KEY.format(organization_id=organization_id)
+    await REDIS_CLIENT.zrem(key, str(user_id))
+
+
+async def is_leaderboard_ready(organization_id: int) -> bool:
+    key = LEADERBOARD_READY_KEY.format(organization_id=organization_id)
+    return bool(await REDIS_CLIENT.exists(key))
+
+
+async def rebuild_leaderboard(
+    organization_id: int, balances: list[tuple[int, int]]
+) -> None:
+    """
+    DB 합계로 순위표 재생성 (Redis 초기화 등으로 순위표가 없는 경우)
+    - 임시 key에 작성 후 교체, 조회 중인 순위표가 비는 구간 없음
+    - 재생성 중 반영된 적립(DB 조회 이후 합계)은 교체 시 함께 반영
+    """
+
+    key = LEADERBOARD_KEY.format(organization_id=organization_id)
+    tmp_key = f"{key}:rebuild:{uuid.uuid4().hex}"
+    if balances:
+        await REDIS_CLIENT.zadd(
+            tmp_key, {str(user_id): balance for user_id, balance in balances}
+        )
+    await replace_leaderboard_script(
+        keys=[
+            key,
+            tmp_key,
+            LEADERBOARD_READY_KEY.format(organization_id=organization_id),
+        ]
+    )
+
+
+async def get_leaderboard_top(
+    organization_id: int, limit: int
+) -> list[tuple[int, int]]:
+    """상위 limit명 (user_id, balance) - O(log n + limit)"""
+
+    key = LEADERBOARD_KEY.format(organization_id=organization_id)
+    rows = await REDIS_CLIENT.zrevrange(key, 0, limit - 1, withscores=True)
+    return [(int(user_id), int(score)) for user_id, score in rows]
+
+
+async def get_leaderboard_rank(organization_id: int, user_id: int) -> int | None:
+    """유저 순위 (1부터), 순위표에 없으면 None - O(log n)"""
+
+    key = LEADERBOARD_KEY.format(organization_id=organization_id)
+    rank = await REDIS_CLIENT.zrevrank(key, str(user_id))
+    return None if rank is None else rank + 1
@@ -2,10 +2,12 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import select, update, and_
+from sqlalchemy import BigInteger, select, update, and_, func, literal
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 
-from src.user.models import User, UserVideoPoint
+from src.auth.hashing import hash_password_async
+from src.user.models import User, UserVideoPoint, UserPointBalance
 from src.user.schemas import UserCreate
 from src.user.exceptions import DuplicateDataException
 
@@ -42,8 +44,8 @@ async def create_admin_user(
         organization_id=org_id,
         email=email,
         is_admin=True,
+        hashed_password=await hash_password_async(password),
     )
-    user.set_password(password)
     db.add(user)
     await db.flush()
 
@@ -51,12 +53,13 @@ async def create_admin_user(
 
 
 async def create_user(db: AsyncSession, org_id: int, data: UserCreate) -> User:
+    hashed_password = await hash_password_async(data.password)
     try:
         user = User(
             organization_id=org_id,
             email=data.email,
+            hashed_password=hashed_password,
         )
-        user.set_password(data.password)
         db.add(user)
         await db.commit()
         await db.refresh(user)
@@ -66,6 +69,47 @@ async def create_user(db: AsyncSession, org_id: int, data: UserCreate) -> User:
         raise DuplicateDataException
 
 
+def make_user_bulk_insert():
+    """
+    유저 일괄 생성 - 기업 내 중복 이메일은 건너뜀 (celery 작업에서도 사용)
+
+    RETURNING email (생성된 유저만)
+    """
+    return (
+        insert(User)
+        .on_conflict_do_nothing(constraint="unique_organization_email")
+        .returning(User.email)
+    )
+
+
+async def get_existing_emails(
+    db: AsyncSession, org_id: int, emails: list[str]
+) -> set[str]:
+    stmt = select(User.email).where(
+        User.organization_id == org_id, User.email.in_(emails)
+    )
+    query = await db.execute(stmt)
+    return set(query.scalars())
+
+
+async def bulk_create_users(db: AsyncSession, rows: list[dict]) -> set[str]:
+    """
+    유저 일괄 생성 후 커밋
+
+    :return set[str]: 생성된 유저 이메일
+    """
+
+    try:
+        result = await db.execute(make_user_bulk_insert(), rows)
+        created = set(result.scalars())
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        raise
+
+    return created
+
+
 async def update_user_password(db: AsyncSession, user_id: int, hashed_password: str):
     stmt = (
         update(User).where(User.id == user_id).values(hashed_password=hashed_password)
@@ -90,16 +134,128 @@ async def soft_delete_user_by_id(db: AsyncSession, user_id: int):
     await db.commit()
 
 
-async def add_user_video_point(db: AsyncSession, user_id: int, video_id: int):
+def make_point_balance_upsert(user_id: int, point: int):
+    """
+    유저 포인트 합계 증가 (없으면 생성) - celery 작업에서도 사용
+
+    RETURNING organization_id, balance
+    """
+
+    stmt = insert(UserPointBalance).from_select(
+        ["user_id", "organization_id", "balance"],
+        select(User.id, User.organization_id, literal(point, BigInteger)).where(
+            User.id == user_id
+        ),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[UserPointBalance.user_id],
+        set_={
+            "balance": UserPointBalance.balance + stmt.excluded.balance,
+            "updated_at": func.now(),
+        },
+    ).returning(UserPointBalance.organization_id, UserPointBalance.balance)
+
+
+def make_point_balance_recompute(organization_id: int):
+    """
+    기업 유저의 포인트 합계를 user_video_points 기준으로 다시 계산 - celery 작업용
+    - 값이 바뀐 유저만 갱신
+
+    RETURNING user_id
+    """
+
+    stmt = insert(UserPointBalance).from_select(
+        ["user_id", "organization_id", "balance"],
+        select(User.id, User.organization_id, func.sum(UserVideoPoint.point))
+        .join(UserVideoPoint, UserVideoPoint.user_id == User.id)
+        .where(User.organization_id == organization_id)
+        .group_by(User.id, User.organization_id),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[UserPointBalance.user_id],
+        set_={"balance": stmt.excluded.balance, "updated_at": func.now()},
+        where=UserPointBalance.balance.is_distinct_from(stmt.excluded.balance),
+    ).returning(UserPointBalance.user_id)
+
+
+async def add_user_video_point(
+    db: AsyncSession, user_id: int, video_id: int
+) -> tuple[int, int] | None:
+    """
+    포인트 저장 + 포인트 합계 갱신 (한 트랜잭션)
+
+    :return: (organization_id, balance), 실패 시 None
+    """
+
     try:
         add_point = UserVideoPoint(
             user_id=user_id,
             video_id=video_id,
         )
         db.add(add_point)
+        await db.flush()
+
+        result = await db.execute(make_point_balance_upsert(user_id, add_point.point))
+        balance = result.one_or_none()
+        await db.commit()
+
+        return tuple(balance) if balance else None
+    except SQLAlchemyError as e:
+        await db.rollback()
+        print("[ERROR]", e)
+
+
+async def add_user_video_point_once(
+    db: AsyncSession, user_id: int, video_id: int, bucket: int
+) -> tuple[int, int] | None:
+    """
+    같은 (유저, 영상, 시간 구간)은 한 번만 저장 - unique key + ON CONFLICT DO NOTHING
+
+    :return: 저장 시 (organization_id, balance), 이미 적립된 경우 None
+    """
+
+    stmt = (
+        insert(UserVideoPoint)
+        .values(user_id=user_id, video_id=video_id, bucket=bucket)
+        .on_conflict_do_nothing(constraint="unique_user_video_point_bucket")
+        .returning(UserVideoPoint.point)
+    )
+    try:
+        point = (await db.execute(stmt)).scalar_one_or_none()
+        if point is None:
+            await db.rollback()
+            return None
+
+        result = await db.execute(make_point_balance_upsert(user_id, point))
+        balance = result.one_or_none()
         await db.commit()
 
-        return
+        return tuple(balance) if balance else None
+
     except SQLAlchemyError as e:
         await db.rollback()
         print("[ERROR]", e)
+        return None
+
+
+async def get_point_balance(db: AsyncSession, user_id: int) -> int:
+    stmt = select(UserPointBalance.balance).where(UserPointBalance.user_id == user_id)
+    query = await db.execute(stmt)
+    return query.scalar() or 0
+
+
+async def get_organization_point_balances(
+    db: AsyncSession, organization_id: int
+) -> list[tuple[int, int]]:
+    """기업 활성 유저의 (user_id, balance) 목록 - 순위표 재생성용"""
+
+    stmt = (
+        select(UserPointBalance.user_id, UserPointBalance.balance)
+        .join(User, User.id == UserPointBalance.user_id)
+        .where(
+            UserPointBalance.organization_id == organization_id,
+            User.is_active.is_(True),
+        )
+    )
+    query = await db.execute(stmt)
+    return [tuple(row) for row in query.all()]
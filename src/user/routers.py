@@ -1,15 +1,25 @@
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_db
 from src.auth.permissions import admin_required, get_current_user
 from src.core.schemas import ErrorResponse
+from src.core.celery.tasks import user as task_user
 from src.user import service as user_svc
 from src.user import exceptions as user_exceptions
-from src.user.schemas import UserCreate, UserRead, AdminUserUpdate, PasswordUpdate
+from src.user.imports import get_import_format
+from src.user.schemas import (
+    UserCreate,
+    UserRead,
+    AdminUserUpdate,
+    PasswordUpdate,
+    UserPointRead,
+    PointLeaderboardRead,
+    UserImportResult,
+    UserImportJobRead,
+)
 from src.user.models import User
 
-
 router = APIRouter(prefix="/user", tags=["user"])
 admin_router = APIRouter(prefix="/admin/user", tags=["admin"])
 
@@ -48,6 +58,106 @@ async def create_user_by_admin(
     return UserRead.from_orm(user)
 
 
+@admin_router.post(
+    "/import",
+    response_model=UserImportResult,
+    summary="유저 일괄 등록",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": user_exceptions.InvalidImportHeaderException().detail,
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            "model": ErrorResponse,
+            "description": user_exceptions.ImportTooLargeException().detail,
+        },
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+            "model": ErrorResponse,
+            "description": user_exceptions.UnsupportedImportFormatException().detail,
+        },
+    },
+)
+async def import_users_by_admin(
+    request: Request,
+    current_user: User = Depends(admin_required),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    유저 일괄 등록 by 어드민
+    - 어드민 토큰 필수
+    - request body: CSV (text/csv, 첫 줄 헤더 email,password) 또는
+      JSON lines (application/x-ndjson, {"email": ..., "password": ...})
+    - 비밀번호 없는 행은 이메일로 초기 비밀번호 설정
+    - 기업 내 중복 이메일 등 실패 행은 행 번호와 사유 반환
+    """
+
+    fmt = get_import_format(request.headers.get("content-type"))
+    return await user_svc.import_users(
+        db=db, org_id=current_user.organization_id, fmt=fmt, stream=request.stream()
+    )
+
+
+@admin_router.post(
+    "/import/jobs",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=UserImportJobRead,
+    summary="유저 일괄 등록 작업 생성",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": user_exceptions.InvalidImportHeaderException().detail,
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            "model": ErrorResponse,
+            "description": user_exceptions.ImportTooLargeException().detail,
+        },
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+            "model": ErrorResponse,
+            "description": user_exceptions.UnsupportedImportFormatException().detail,
+        },
+    },
+)
+async def create_user_import_job(
+    request: Request,
+    current_user: User = Depends(admin_required),
+):
+    """
+    유저 일괄 등록을 celery 작업으로 실행 (대량 등록용)
+    - 요청 형식은 POST /admin/user/import 와 동일
+    - 진행 상태는 GET /admin/user/import/jobs/{job_id} 로 조회
+    """
+
+    fmt = get_import_format(request.headers.get("content-type"))
+    job_id, tmp_path = await user_svc.create_import_job(
+        admin=current_user, fmt=fmt, stream=request.stream()
+    )
+    task_user.import_users.delay(job_id, current_user.organization_id, fmt, tmp_path)
+
+    return UserImportJobRead(job_id=job_id, status="PENDING")
+
+
+@admin_router.get(
+    "/import/jobs/{job_id}",
+    response_model=UserImportJobRead,
+    summary="유저 일괄 등록 작업 조회",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": user_exceptions.ImportJobNotFoundException().detail,
+        },
+    },
+)
+async def read_user_import_job(
+    job_id: str = Path(..., description="작업 ID"),
+    current_user: User = Depends(admin_required),
+):
+    """
+    유저 일괄 등록 작업 진행 상태
+    - 실패 행 목록은 작업 완료 후 반환
+    """
+    return await user_svc.get_import_job(job_id=job_id, admin=current_user)
+
+
 @admin_router.put(
     "/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -145,3 +255,37 @@ async def delete_user(
     - 토큰 필수
     """
     return await user_svc.soft_delete_user(db=db, user=current_user)
+
+
+@router.get("/me/points", response_model=UserPointRead, summary="내 포인트 조회")
+async def read_user_point(
+    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    """
+    로그인 유저 포인트 합계 및 기업 내 순위
+    - 토큰 필수
+    """
+    return await user_svc.get_user_point(db=db, user=current_user)
+
+
+@router.get(
+    "/leaderboard",
+    response_model=PointLeaderboardRead,
+    summary="기업 포인트 순위 조회",
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ErrorResponse,
+            "description": user_exceptions.LeaderboardUnavailableException().detail,
+        },
+    },
+)
+async def read_point_leaderboard(
+    limit: int = Query(10, ge=1, le=100, description="조회 인원"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    로그인 유저 기업의 포인트 상위 유저 목록
+    - 토큰 필수
+    """
+    return await user_svc.get_point_leaderboard(db=db, user=current_user, limit=limit)
@@ -67,3 +67,52 @@ class AdminUserUpdate(PasswordUpdate):
     is_admin: Annotated[
         Optional[bool], Field(None, description="어드민 권한 여부", example=True)
     ]
+
+
+class UserPointRead(BaseModel):
+    point: Annotated[int, Field(..., description="포인트 합계", example=120)]
+    rank: Annotated[Optional[int], Field(None, description="기업 내 순위", example=3)]
+
+
+class LeaderboardEntry(BaseModel):
+    rank: Annotated[int, Field(..., description="순위", example=1)]
+    user_id: Annotated[int, Field(..., description="유저 id", example=2)]
+    point: Annotated[int, Field(..., description="포인트 합계", example=300)]
+
+
+class PointLeaderboardRead(BaseModel):
+    items: Annotated[list[LeaderboardEntry], Field(description="상위 유저 목록")]
+    my_rank: Annotated[
+        Optional[int], Field(None, description="로그인 유저 순위", example=3)
+    ]
+
+
+class UserImportError(BaseModel):
+    line: Annotated[int, Field(..., description="행 번호 (1부터)", example=3)]
+    email: Annotated[
+        Optional[str], Field(None, description="이메일", example="user1@example.com")
+    ]
+    reason: Annotated[
+        str, Field(..., description="실패 사유", example="이미 존재하는 이메일입니다.")
+    ]
+
+
+class UserImportResult(BaseModel):
+    total: Annotated[int, Field(0, description="처리한 행 수", example=1000)]
+    created: Annotated[int, Field(0, description="생성된 유저 수", example=998)]
+    failed: Annotated[int, Field(0, description="실패한 행 수", example=2)]
+    errors: Annotated[
+        list[UserImportError],
+        Field(
+            default_factory=list,
+            description="실패 행 목록 (최대 USER_IMPORT_MAX_ERRORS)",
+        ),
+    ]
+
+
+class UserImportJobRead(UserImportResult):
+    job_id: Annotated[str, Field(..., description="작업 ID")]
+    status: Annotated[
+        str,
+        Field(..., description="PENDING | RUNNING | DONE | FAILED", example="RUNNING"),
+    ]
@@ -1,12 +1,30 @@
+import os
+from datetime import datetime
+
 from aioredlock.errors import AioredlockError
+from redis.exceptions import RedisError
+from typing import AsyncIterator
+
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import LOCK_MANAGER
-from src.auth.serivce import hash_password
+from src.core.config import LOCK_MANAGER, POINT_ACCRUAL_MODE
+from src.auth import cache as auth_cache
+from src.auth.hashing import hash_password_async, hash_passwords_async
 from src.user import repository as user_repo
 from src.user import exceptions as user_exceptions
+from src.user import points as user_points
+from src.user import imports as user_imports
 from src.user.models import User
-from src.user.schemas import UserCreate, AdminUserUpdate
+from src.user.schemas import (
+    UserCreate,
+    UserImportResult,
+    UserImportJobRead,
+    AdminUserUpdate,
+    UserPointRead,
+    LeaderboardEntry,
+    PointLeaderboardRead,
+)
 
 
 async def create_user_by_admin(db: AsyncSession, org_id: int, data: UserCreate) -> User:
@@ -18,9 +36,86 @@ async def create_user_by_admin(db: AsyncSession, org_id: int, data: UserCreate)
     return await user_repo.create_user(db=db, org_id=org_id, data=data)
 
 
+async def import_users(
+    db: AsyncSession, org_id: int, fmt: str, stream: AsyncIterator[bytes]
+) -> UserImportResult:
+    """
+    유저 일괄 등록 by 어드민
+
+    - 요청 body를 한 줄씩 읽어 USER_IMPORT_BATCH_SIZE 단위로 저장
+    - batch마다 비밀번호 병렬 해시 -> INSERT 한 번 -> 커밋
+    - 기업 내 중복 이메일은 건너뛰고 실패 행으로 기록
+    """
+
+    importer = user_imports.UserImporter(fmt)
+    async for line in user_imports.iter_lines(stream):
+        if importer.add_line(line):
+            await save_import_batch(db, org_id, importer)
+    await save_import_batch(db, org_id, importer)
+
+    return importer.result
+
+
+async def save_import_batch(
+    db: AsyncSession, org_id: int, importer: user_imports.UserImporter
+) -> None:
+    batch = importer.take_batch()
+    if not batch:
+        return
+
+    try:
+        # 이미 있는 이메일은 해시 생략 (동시 등록은 INSERT ON CONFLICT로 처리)
+        existing = await user_repo.get_existing_emails(
+            db, org_id, [user.email for _, user in batch]
+        )
+        await db.commit()  # 해시 동안 트랜잭션을 열어두지 않음
+
+        new_users = [(line, user) for line, user in batch if user.email not in existing]
+        created = set()
+        if new_users:
+            hashed_passwords = await hash_passwords_async(
+                [user.password for _, user in new_users]
+            )
+            rows = user_imports.make_import_rows(org_id, new_users, hashed_passwords)
+            created = await user_repo.bulk_create_users(db, rows)
+
+    except SQLAlchemyError as e:
+        print("[ERROR]", e)
+        raise user_exceptions.UserImportFailedException
+
+    importer.record_batch(batch, created)
+
+
+async def create_import_job(
+    admin: User, fmt: str, stream: AsyncIterator[bytes]
+) -> tuple[str, str]:
+    """
+    celery 일괄 등록 작업 준비 - 요청 body를 임시 파일로 저장 후 작업 상태 생성
+
+    :return tuple[str, str]: (작업 ID, 임시 파일 경로)
+    """
+
+    tmp_path = await user_imports.save_import_file(stream)
+    try:
+        job_id = await user_imports.create_import_job(admin.organization_id)
+    except RedisError:
+        os.remove(tmp_path)
+        raise
+
+    return job_id, tmp_path
+
+
+async def get_import_job(job_id: str, admin: User) -> UserImportJobRead:
+    job = await user_imports.get_import_job(job_id)
+    if not job or job["organization_id"] != admin.organization_id:
+        raise user_exceptions.ImportJobNotFoundException
+
+    return UserImportJobRead(job_id=job_id, **job)
+
+
 async def update_user(db: AsyncSession, new_password: str, user: User):
     """유저 본인 비밀번호 변경"""
-    hashed_pw = hash_password(new_password)
+    hashed_pw = await hash_password_async(new_password)
     await user_repo.update_user_password(db, user.id, hashed_pw)
 
 
@@ -37,16 +132,19 @@ async def update_user_by_admin(
         raise user_exceptions.UnauthorizedAccessException
 
     if data.new_password:
-        hashed_pw = hash_password(data.new_password)
+        hashed_pw = await hash_password_async(data.new_password)
         await user_repo.update_user_password(db, user_id, hashed_pw)
 
     if data.is_admin is not None:
         await user_repo.update_user_admin_status(db, user_id, data.is_admin)
+        await auth_cache.invalidate_user(user_id)
 
 
 async def soft_delete_user(db: AsyncSession, user: User):
     """본인 계정 삭제"""
     await user_repo.soft_delete_user_by_id(db, user_id=user.id)
+    await auth_cache.invalidate_user(user.id)
+    await remove_from_leaderboard(user.organization_id, user.id)
 
 
 async def soft_delete_user_by_admin(db: AsyncSession, admin: User, user_id: int):
@@ -61,6 +159,50 @@ async def soft_delete_user_by_admin(db: AsyncSession, admin: User, user_id: int)
         raise user_exceptions.UnauthorizedAccessException
 
     await user_repo.soft_delete_user_by_id(db, user_id=user_id)
+    await auth_cache.invalidate_user(user_id)
+    await remove_from_leaderboard(user.organization_id, user_id)
+
+
+async def add_user_video_point(db: AsyncSession, user_id: int, video_id: int) -> None:
+    """영상 조회 포인트 적립 - POINT_ACCRUAL_MODE 설정에 따라 처리"""
+
+    if POINT_ACCRUAL_MODE == "buffered":
+        await add_user_video_point_buffered(user_id, video_id)
+    elif POINT_ACCRUAL_MODE == "idempotent":
+        await add_user_video_point_idempotent(db, user_id, video_id)
+    else:
+        await add_user_video_point_with_lock(db, user_id, video_id)
+
+
+async def add_user_video_point_idempotent(
+    db: AsyncSession, user_id: int, video_id: int
+) -> None:
+    """
+    유저 포인트 등록 - DB unique key로 중복 방지 (락 없음)
+
+    - 같은 영상은 POINT_DEDUP_WINDOW 구간마다 한 번만 적립
+    - 동시 요청은 ON CONFLICT DO NOTHING으로 하나만 저장 (429 발생 없음)
+    """
+
+    bucket = user_points.get_point_bucket(datetime.now())
+    balance = await user_repo.add_user_video_point_once(db, user_id, video_id, bucket)
+    await update_leaderboard(user_id, balance)
+
+
+async def add_user_video_point_buffered(user_id: int, video_id: int) -> None:
+    """
+    유저 포인트 등록 - Redis 적재 (락, DB 쓰기 없음)
+
+    - 같은 영상은 POINT_DEDUP_WINDOW 동안 한 번만 적립
+    - DB 저장은 celery 작업(flush_buffered_points)에서 일괄 처리
+    """
+
+    try:
+        await user_points.buffer_user_video_point(user_id, video_id)
+
+    except RedisError as e:
+        print("[ERROR]", e)
+        raise user_exceptions.AddPointException
 
 
 async def add_user_video_point_with_lock(
@@ -80,7 +222,7 @@ async def add_user_video_point_with_lock(
 
     try:
         lock = await LOCK_MANAGER.lock(lock_key, lock_timeout=10000)
-        await user_repo.add_user_video_point(db, user_id, video_id)
+        balance = await user_repo.add_user_video_point(db, user_id, video_id)
 
     except AioredlockError as e:
         print("[ERROR]", e)
@@ -89,3 +231,78 @@ async def add_user_video_point_with_lock(
     finally:
         if lock:
             await LOCK_MANAGER.unlock(lock)
+
+    await update_leaderboard(user_id, balance)
+
+
+async def update_leaderboard(user_id: int, balance: tuple[int, int] | None) -> None:
+    """
+    포인트 적립 후 기업 순위표 갱신
+    - 순위표 갱신 실패는 적립 결과에 영향 없음 (조회 시 DB 기준으로 재생성)
+    """
+
+    if balance is None:
+        return
+
+    organization_id, point = balance
+    try:
+        await user_points.update_leaderboard(organization_id, user_id, point)
+    except RedisError as e:
+        print("[ERROR]", e)
+
+
+async def remove_from_leaderboard(organization_id: int, user_id: int) -> None:
+    try:
+        await user_points.remove_from_leaderboard(organization_id, user_id)
+    except RedisError as e:
+        print("[ERROR]", e)
+
+
+async def get_user_point(db: AsyncSession, user: User) -> UserPointRead:
+    """
+    유저 포인트 합계 + 기업 내 순위
+    - buffered 모드는 celery 일괄 저장 이후 반영
+    """
+
+    point = await user_repo.get_point_balance(db, user.id)
+    try:
+        await ensure_leaderboard(db, user.organization_id)
+        rank = await user_points.get_leaderboard_rank(user.organization_id, user.id)
+    except RedisError as e:
+        print("[ERROR]", e)
+        rank = None
+
+    return UserPointRead(point=point, rank=rank)
+
+
+async def get_point_leaderboard(
+    db: AsyncSession, user: User, limit: int
+) -> PointLeaderboardRead:
+    """기업 포인트 상위 limit명 (Redis sorted set)"""
+
+    try:
+        await ensure_leaderboard(db, user.organization_id)
+        top = await user_points.get_leaderboard_top(user.organization_id, limit)
+        my_rank = await user_points.get_leaderboard_rank(user.organization_id, user.id)
+
+    except RedisError as e:
+        print("[ERROR]", e)
+        raise user_exceptions.LeaderboardUnavailableException
+
+    return PointLeaderboardRead(
+        items=[
+            LeaderboardEntry(rank=rank, user_id=user_id, point=point)
+            for rank, (user_id, point) in enumerate(top, start=1)
+        ],
+        my_rank=my_rank,
+    )
+
+
+async def ensure_leaderboard(db: AsyncSession, organization_id: int) -> None:
+    """순위표가 없으면 DB 포인트 합계로 재생성"""
+
+    if await user_points.is_leaderboard_ready(organization_id):
+        return
+
+    balances = await user_repo.get_organization_point_balances(db, organization_id)
+    await user_points.rebuild_leaderboard(organization_id, balances)
@@ -1,4 +1,7 @@
+from fastapi import status
 from src.core.exceptions import (
+    AppBaseException,
+    DuplicateDataException,
     ForbiddenException,
     NotFoundException,
     InternalServerErrorException,
@@ -38,3 +41,54 @@ class VideoUploadException(InternalServerErrorException):
 class VideoStreamingException(InternalServerErrorException):
     def __init__(self):
         super().__init__("영상 재생 중 오류가 발생했습니다.")
+
+
+class VideoRangeNotSatisfiableException(AppBaseException):
+    def __init__(self, file_size: int = 0):
+        super().__init__(
+            detail="요청한 영상 범위가 올바르지 않습니다.",
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+
+
+class UploadSessionNotFoundException(NotFoundException):
+    def __init__(self):
+        super().__init__("업로드 세션을 찾을 수 없습니다.")
+
+
+class UploadInProgressException(DuplicateDataException):
+    def __init__(self):
+        super().__init__("다른 요청에서 업로드가 진행 중입니다.")
+
+
+class UploadOffsetMismatchException(AppBaseException):
+    def __init__(self, offset: int = 0):
+        super().__init__(
+            detail="업로드 offset이 일치하지 않습니다.",
+            status_code=status.HTTP_409_CONFLICT,
+            headers={"Upload-Offset": str(offset)},
+        )
+
+
+class UploadIncompleteException(DuplicateDataException):
+    def __init__(self):
+        super().__init__("아직 업로드가 완료되지 않았습니다.")
+
+
+class UploadLengthExceededException(AppBaseException):
+    def __init__(self):
+        super().__init__(
+            detail="업로드 파일 크기를 초과했습니다.",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+
+class VideoNotReadyException(DuplicateDataException):
+    def __init__(self):
+        super().__init__("영상 변환 작업이 아직 완료되지 않았습니다.")
+
+
+class InvalidCursorException(AppBaseException):
+    def __init__(self):
+        super().__init__(detail="목록 조회 cursor가 올바르지 않습니다.")
@@ -1,10 +1,41 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, ForeignKey, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Text,
+    Index,
+    FetchedValue,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from src.db.base import Base, TimestampModel
 
 
 class Video(Base, TimestampModel):
     __tablename__ = "videos"
+    __table_args__ = (
+        # 기업별 영상 목록 (created_at, id) keyset 페이지네이션
+        Index(
+            "ix_videos_org_deleted_created",
+            "organization_id",
+            "is_deleted",
+            "created_at",
+            "id",
+        ),
+        # 기업별 제목/설명 검색 (btree_gin 확장 필요)
+        Index(
+            "ix_videos_org_search",
+            "organization_id",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
@@ -14,8 +45,40 @@ class Video(Base, TimestampModel):
     title = Column(String(250), nullable=False, index=True, doc="영상 제목")
     description = Column(Text, nullable=False, doc="영상 설명")
     path = Column(String(300), nullable=True, doc="업로드 경로")
+    content_hash = Column(
+        String(64),
+        ForeignKey("video_blobs.content_hash"),
+        nullable=True,
+        index=True,
+        doc="영상 파일 SHA-256",
+    )
+    is_faststart = Column(
+        Boolean, nullable=True, doc="moov atom 앞쪽 배치 여부, Null이면 MP4 아님/미확인"
+    )
+    hls_playlist = Column(String(300), nullable=True, doc="HLS 플레이리스트 경로")
+    # 한국어 형태소 분석 사전이 없으므로 simple 사전 (공백 기준 토큰, 접두어 검색으로 보완)
+    # DB 트리거(videos_search_vector_update)에서 title/description 변경 시 갱신
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            server_default=FetchedValue(),
+            server_onupdate=FetchedValue(),
+            doc="제목/설명 검색 벡터 (제목 가중치 A, 설명 B)",
+        )
+    )
     is_deleted = Column(Boolean, default=False, nullable=False, doc="삭제 여부")
     deleted_at = Column(DateTime, nullable=True, doc="삭제일시")
 
     organization = relationship("Organization", backref="videos", lazy="raise")
     uploader = relationship("User", backref="videos", lazy="raise")
+
+
+class VideoBlob(Base, TimestampModel):
+    """SHA-256 기준으로 저장되는 영상 파일 - 같은 파일은 한 번만 저장"""
+
+    __tablename__ = "video_blobs"
+
+    content_hash = Column(String(64), primary_key=True, doc="영상 파일 SHA-256")
+    path = Column(String(300), nullable=False, doc="저장 경로")
+    size = Column(BigInteger, nullable=False, doc="파일 크기(byte)")
+    ref_count = Column(Integer, nullable=False, default=0, doc="참조 영상 수")
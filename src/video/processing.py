@@ -0,0 +1,402 @@
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from src.core.config import (
+    TEMP_UPLOAD_DIR,
+    FFMPEG_PATH,
+    FFPROBE_PATH,
+    FFMPEG_TIMEOUT,
+    HLS_SEGMENT_SECONDS,
+)
+from src.core.storage import get_storage
+
+HLS_PLAYLIST_NAME = "index.m3u8"
+HLS_INIT_NAME = "init.mp4"
+HLS_SEGMENT_PATTERN = "seg_%05d.m4s"
+SOURCE_RENDITION = "source"  # 재인코딩 없이 원본 화질로 분할
+MP4_BOX_HEADER = struct.Struct(">I4s")  # box 크기(4) + 타입(4)
+
+HLS_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".m4s": "video/iso.segment",
+    ".mp4": "video/mp4",
+    ".ts": "video/mp2t",
+}
+
+
+class VideoProcessingError(Exception):
+    """ffmpeg 처리 실패"""
+
+
+class Rendition(BaseModel):
+    """ABR 변환 화질"""
+
+    name: str
+    height: int
+    video_bitrate: int  # kbps
+    audio_bitrate: int = 128  # kbps
+
+
+RENDITIONS = {
+    rendition.name: rendition
+    for rendition in [
+        Rendition(name="1080p", height=1080, video_bitrate=5000, audio_bitrate=192),
+        Rendition(name="720p", height=720, video_bitrate=2800),
+        Rendition(name="480p", height=480, video_bitrate=1400),
+        Rendition(name="360p", height=360, video_bitrate=800, audio_bitrate=96),
+    ]
+}
+
+
+class VideoProbe(BaseModel):
+    """원본 영상 정보"""
+
+    width: int
+    height: int
+    bit_rate: int | None = None  # bps
+
+
+class Variant(BaseModel):
+    """master 플레이리스트 항목"""
+
+    name: str
+    bandwidth: int  # bps
+    width: int
+    height: int
+
+
+def get_hls_prefix(content_hash: str) -> str:
+    """HLS 결과물 저장소 key prefix (같은 파일이면 결과물 공유)"""
+    return f"hls/{content_hash}"
+
+
+def get_rendition_prefix(content_hash: str, name: str) -> str:
+    return f"{get_hls_prefix(content_hash)}/{name}"
+
+
+def get_master_playlist_key(content_hash: str, names: list[str]) -> str:
+    """변환 목록마다 master 플레이리스트 분리 (rendition 결과물은 공유)"""
+    return f"{get_hls_prefix(content_hash)}/master_{'-'.join(names)}.m3u8"
+
+
+def run_ffmpeg(args: list[str], binary: str = FFMPEG_PATH) -> str:
+    """ffmpeg 실행, 실패 시 stderr 마지막 부분을 담아 예외 발생"""
+
+    command = [binary, "-hide_banner", "-loglevel", "error", *args]
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, timeout=FFMPEG_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise VideoProcessingError(str(e)) from e
+
+    if result.returncode != 0:
+        raise VideoProcessingError(result.stderr[-2000:])
+
+    return result.stdout
+
+
+def probe_video(source: str) -> VideoProbe:
+    """ffprobe로 영상 해상도 / 비트레이트 조회 (로컬 경로 또는 URL)"""
+
+    output = run_ffmpeg(
+        [
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=width,height:format=bit_rate",
+            "-of",
+            "json",
+            source,
+        ],
+        binary=FFPROBE_PATH,
+    )
+    try:
+        info = json.loads(output)
+        stream = info["streams"][0]
+        bit_rate = info.get("format", {}).get("bit_rate")
+        return VideoProbe(
+            width=stream["width"],
+            height=stream["height"],
+            bit_rate=int(bit_rate) if bit_rate else None,
+        )
+    except (ValueError, KeyError, IndexError) as e:
+        raise VideoProcessingError(f"영상 정보 조회 실패: {e}") from e
+
+
+def select_renditions(names: list[str], source_height: int) -> list[Rendition]:
+    """
+    원본보다 높은 화질은 제외하고 높은 화질 순으로 정렬
+    - 해당하는 화질이 없으면 빈 목록 (원본 화질로 분할)
+    """
+
+    renditions = [
+        RENDITIONS[name]
+        for name in dict.fromkeys(names)
+        if name in RENDITIONS and RENDITIONS[name].height <= source_height
+    ]
+    return sorted(renditions, key=lambda r: r.height, reverse=True)
+
+
+def make_variant(rendition: Rendition | None, probe: VideoProbe) -> Variant:
+    if rendition is None:
+        return Variant(
+            name=SOURCE_RENDITION,
+            bandwidth=probe.bit_rate or 0,
+            width=probe.width,
+            height=probe.height,
+        )
+
+    # 원본 비율 유지, 짝수 너비 (scale=-2 와 동일)
+    width = round(probe.width * rendition.height / probe.height / 2) * 2
+    return Variant(
+        name=rendition.name,
+        bandwidth=(rendition.video_bitrate + rendition.audio_bitrate) * 1000,
+        width=width,
+        height=rendition.height,
+    )
+
+
+def make_master_playlist(variants: list[Variant], content_hash: str) -> str:
+    """
+    화질별 플레이리스트 경로 앞에 파일 해시 추가 (예: <hash>/720p/index.m3u8)
+    - 영상 파일이 교체되면 세그먼트 주소도 바뀌므로 세그먼트 장기 캐시 가능
+    """
+
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for variant in variants:
+        lines.append(
+            f"#EXT-X-STREAM-INF:BANDWIDTH={variant.bandwidth},"
+            f"RESOLUTION={variant.width}x{variant.height}"
+        )
+        lines.append(f"{content_hash}/{variant.name}/{HLS_PLAYLIST_NAME}")
+
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def local_source(key: str) -> Iterator[str]:
+    """
+    저장소 객체의 로컬 경로
+    - 로컬 저장소는 원본 경로, 원격 저장소는 임시 파일로 다운로드 후 삭제
+    """
+
+    storage = get_storage()
+    path = storage.local_path(key)
+    if path is not None:
+        yield path
+        return
+
+    os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=TEMP_UPLOAD_DIR, suffix=os.path.splitext(key)[1]
+    )
+    os.close(fd)
+    try:
+        storage.download_file(key, tmp_path)
+        yield tmp_path
+    finally:
+        os.remove(tmp_path)
+
+
+def get_encode_args(rendition: Rendition | None) -> list[str]:
+    """
+    rendition 인코딩 옵션
+    - None: 재인코딩 없이 복사
+    - 세그먼트 경계마다 키프레임 강제 -> 화질 간 세그먼트 정렬 (ABR 전환)
+    """
+
+    if rendition is None:
+        return ["-c", "copy"]
+
+    return [
+        "-vf",
+        f"scale=-2:{rendition.height}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-profile:v",
+        "main",
+        "-b:v",
+        f"{rendition.video_bitrate}k",
+        "-maxrate",
+        f"{int(rendition.video_bitrate * 1.07)}k",
+        "-bufsize",
+        f"{int(rendition.video_bitrate * 1.5)}k",
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{HLS_SEGMENT_SECONDS})",
+        "-sc_threshold",
+        "0",
+        "-c:a",
+        "aac",
+        "-b:a",
+        f"{rendition.audio_bitrate}k",
+        "-ac",
+        "2",
+    ]
+
+
+def segment_hls(
+    source_path: str, output_dir: str, rendition: Rendition | None = None
+) -> None:
+    """
+    영상을 fMP4 HLS 세그먼트로 분할
+
+    - HLS_SEGMENT_SECONDS 단위 분할
+    - 결과: index.m3u8 + init.mp4 + seg_00000.m4s ...
+    """
+
+    run_ffmpeg(
+        [
+            "-y",
+            "-i",
+            source_path,
+            "-map",
+            "0:v:0",
+            "-map",
+            "0:a:0?",
+            *get_encode_args(rendition),
+            "-f",
+            "hls",
+            "-hls_time",
+            str(HLS_SEGMENT_SECONDS),
+            "-hls_playlist_type",
+            "vod",
+            "-hls_segment_type",
+            "fmp4",
+            "-hls_fmp4_init_filename",
+            HLS_INIT_NAME,
+            "-hls_segment_filename",
+            os.path.join(output_dir, HLS_SEGMENT_PATTERN),
+            os.path.join(output_dir, HLS_PLAYLIST_NAME),
+        ]
+    )
+
+
+def upload_directory(local_dir: str, prefix: str) -> None:
+    """
+    디렉토리 파일을 저장소 prefix 하위로 업로드
+    - 플레이리스트(.m3u8)는 마지막에 올려 세그먼트가 모두 있는 상태에서만 노출
+    """
+
+    storage = get_storage()
+    filenames = sorted(os.listdir(local_dir), key=lambda name: name.endswith(".m3u8"))
+    for filename in filenames:
+        storage.put_file(f"{prefix}/{filename}", os.path.join(local_dir, filename))
+
+
+def put_text(key: str, text: str) -> None:
+    """문자열을 저장소 객체로 저장 (플레이리스트 등)"""
+
+    os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=TEMP_UPLOAD_DIR)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        get_storage().put_file(key, tmp_path)
+    finally:
+        os.remove(tmp_path)
+
+
+def create_hls(source_key: str, prefix: str, rendition: Rendition | None = None) -> str:
+    """
+    원본 영상으로 HLS 결과물 생성 후 저장소 prefix 하위에 업로드
+    - 이미 변환된 결과물이 있으면 재사용
+
+    :return str: 플레이리스트 저장소 key
+    """
+
+    playlist_key = f"{prefix}/{HLS_PLAYLIST_NAME}"
+    if get_storage().exists(playlist_key):
+        return playlist_key
+
+    os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
+    output_dir = tempfile.mkdtemp(dir=TEMP_UPLOAD_DIR, prefix="hls_")
+    try:
+        with local_source(source_key) as source_path:
+            segment_hls(source_path, output_dir, rendition)
+        upload_directory(output_dir, prefix)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return playlist_key
+
+
+def is_faststart(path: str) -> bool | None:
+    """
+    MP4 최상위 box 순서로 faststart 여부 확인
+
+    :return: moov가 mdat보다 앞이면 True, 뒤면 False, MP4가 아니면 None
+    """
+
+    with open(path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        offset = 0
+
+        while offset + MP4_BOX_HEADER.size <= file_size:
+            f.seek(offset)
+            size, box_type = MP4_BOX_HEADER.unpack(f.read(MP4_BOX_HEADER.size))
+            if offset == 0 and box_type != b"ftyp":
+                return None
+
+            if size == 1:  # 64bit 크기
+                size = struct.unpack(">Q", f.read(8))[0]
+            elif size == 0:  # 파일 끝까지
+                size = file_size - offset
+
+            if box_type == b"moov":
+                return True
+            if box_type == b"mdat":
+                return False
+            if size < MP4_BOX_HEADER.size:
+                return None
+            offset += size
+
+    return None
+
+
+def ensure_faststart(path: str) -> tuple[bool | None, bool]:
+    """
+    moov atom이 뒤에 있는 MP4를 재인코딩 없이 faststart 구조로 변환 (원본 파일 교체)
+
+    :return: (faststart 여부, 파일 변경 여부) - MP4가 아니면 (None, False)
+    """
+
+    faststart = is_faststart(path)
+    if faststart is not False:
+        return faststart, False
+
+    remux_path = f"{path}.faststart.mp4"
+    try:
+        run_ffmpeg(
+            [
+                "-y",
+                "-i",
+                path,
+                "-map",
+                "0",
+                "-c",
+                "copy",
+                "-fflags",
+                "+bitexact",
+                "-movflags",
+                "+faststart",
+                remux_path,
+            ]
+        )
+        os.replace(remux_path, path)
+    except (VideoProcessingError, OSError):
+        if os.path.exists(remux_path):
+            os.remove(remux_path)
+        raise
+
+    return True, True
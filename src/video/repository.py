@@ -1,12 +1,14 @@
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, tuple_
 from sqlalchemy.orm import joinedload
 
 from src.video.models import Video
 from src.video import exceptions as video_exceptions
 
+SEARCH_CONFIG = "simple"  # Video.search_vector 생성 시 사용한 사전
+
 
 async def get_video_by_id(db: AsyncSession, video_id: int) -> Video:
     stmt = (
@@ -18,6 +20,56 @@ async def get_video_by_id(db: AsyncSession, video_id: int) -> Video:
     return query.scalar_one_or_none()
 
 
+async def get_videos_page(
+    db: AsyncSession,
+    org_id: int,
+    limit: int,
+    cursor: tuple[datetime, int] | None = None,
+    is_deleted: bool = False,
+):
+    """
+    기업 영상 목록 (최신순, keyset 페이지네이션)
+    - (organization_id, is_deleted, created_at, id) 인덱스 역순 스캔
+    - 다음 페이지 확인을 위해 limit + 1 개 조회
+    """
+
+    stmt = (
+        select(Video.id, Video.title, Video.description, Video.path, Video.created_at)
+        .where(Video.organization_id == org_id, Video.is_deleted == is_deleted)
+        .order_by(Video.created_at.desc(), Video.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Video.created_at, Video.id) < tuple_(*cursor))
+
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def search_videos(db: AsyncSession, org_id: int, ts_query: str, limit: int):
+    """
+    기업 영상 제목/설명 검색 (관련도순)
+    - ix_videos_org_search GIN 인덱스 (organization_id, search_vector) 사용
+    - 같은 관련도는 최신순
+    """
+
+    query = func.to_tsquery(SEARCH_CONFIG, ts_query)
+    rank = func.ts_rank_cd(Video.search_vector, query)
+    stmt = (
+        select(Video.id, Video.title, Video.description, Video.path, Video.created_at)
+        .where(
+            Video.organization_id == org_id,
+            Video.is_deleted == False,
+            Video.search_vector.op("@@")(query),
+        )
+        .order_by(rank.desc(), Video.created_at.desc(), Video.id.desc())
+        .limit(limit)
+    )
+
+    result = await db.execute(stmt)
+    return result.all()
+
+
 async def update_video_fields(
     db: AsyncSession, video: Video, title: str | None, description: str | None
 ):
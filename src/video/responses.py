@@ -0,0 +1,169 @@
+import os
+import uuid
+
+import anyio
+from fastapi import status
+from fastapi.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from src.core.config import VIDEO_SEND_BACKEND
+from src.core.storage import get_storage
+from src.video.utils import make_content_range, make_multipart_headers
+
+ZERO_COPY_SEND = "http.response.zerocopysend"
+PATH_SEND = "http.response.pathsend"
+
+
+class VideoFileResponse(Response):
+    """
+    저장된 영상 파일 응답 (전체 / single range / multi range)
+
+    ASGI 서버가 지원하는 전송 방식을 선택
+    - http.response.zerocopysend: 서버가 os.sendfile로 fd -> socket 직접 전송
+    - http.response.pathsend: 서버가 파일 경로로 직접 전송 (전체 응답만 가능)
+    - 미지원 서버 또는 원격 저장소(S3 등): CHUNK_SIZE 단위 buffered 전송
+    """
+
+    def __init__(
+        self,
+        key: str,
+        file_size: int,
+        ranges: list[tuple[int, int]] | None = None,
+        headers: dict[str, str] | None = None,
+        media_type: str = "video/mp4",
+    ):
+        self.key = key
+        self.storage = get_storage()
+        self.path = self.storage.local_path(key)
+        self.file_size = file_size
+        self.ranges = ranges or []
+        self.background = None
+        self.body = None
+        self.part_headers: list[bytes] = []
+        self.closing = b""
+
+        headers = {"Accept-Ranges": "bytes", **(headers or {})}
+
+        if not self.ranges:
+            self.status_code = status.HTTP_200_OK
+            self.media_type = media_type
+            headers["Content-Length"] = str(file_size)
+
+        elif len(self.ranges) == 1:
+            start, end = self.ranges[0]
+            self.status_code = status.HTTP_206_PARTIAL_CONTENT
+            self.media_type = media_type
+            headers["Content-Range"] = make_content_range(start, end, file_size)
+            headers["Content-Length"] = str(end - start + 1)
+
+        else:
+            boundary = uuid.uuid4().hex
+            self.status_code = status.HTTP_206_PARTIAL_CONTENT
+            self.media_type = f"multipart/byteranges; boundary={boundary}"
+            self.part_headers, self.closing = make_multipart_headers(
+                self.ranges, file_size, boundary, media_type
+            )
+            content_length = sum(len(header) for header in self.part_headers)
+            content_length += len(self.closing)
+            content_length += sum(end - start + 1 for start, end in self.ranges)
+            headers["Content-Length"] = str(content_length)
+
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        extensions = scope.get("extensions") or {}
+        use_sendfile = VIDEO_SEND_BACKEND != "buffered" and self.path is not None
+        if use_sendfile and ZERO_COPY_SEND in extensions:
+            await self.send_zero_copy(send)
+        elif use_sendfile and PATH_SEND in extensions and not self.ranges:
+            await send({"type": PATH_SEND, "path": os.path.abspath(self.path)})
+        else:
+            await self.send_buffered(send)
+
+    def iter_parts(self) -> list[tuple[bytes, int, int]]:
+        """(파트 헤더, 시작 위치, 전송 바이트 수) 목록"""
+
+        if not self.ranges:
+            return [(b"", 0, self.file_size)]
+
+        if len(self.ranges) == 1:
+            start, end = self.ranges[0]
+            return [(b"", start, end - start + 1)]
+
+        return [
+            (header, start, end - start + 1)
+            for (start, end), header in zip(self.ranges, self.part_headers)
+        ]
+
+    async def send_zero_copy(self, send: Send) -> None:
+        """서버의 sendfile 전송 사용 - 영상 바이트가 userspace를 거치지 않음"""
+
+        video_file = await anyio.to_thread.run_sync(open, self.path, "rb")
+        try:
+            for header, offset, count in self.iter_parts():
+                if header:
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": header,
+                            "more_body": True,
+                        }
+                    )
+                await send(
+                    {
+                        "type": ZERO_COPY_SEND,
+                        "file": video_file,
+                        "offset": offset,
+                        "count": count,
+                        "more_body": True,
+                    }
+                )
+
+            await send(
+                {"type": "http.response.body", "body": self.closing, "more_body": False}
+            )
+        finally:
+            await anyio.to_thread.run_sync(video_file.close)
+
+    async def send_buffered(self, send: Send) -> None:
+        """
+        저장소 range 읽기로 buffered 전송
+        - 전송 중 오류는 응답 헤더가 이미 전송되어 HTTP 오류 응답 불가
+          -> 로그 후 본문을 끝내지 않고 종료, 서버가 연결을 닫아 클라이언트는
+             Content-Length보다 짧은 응답으로 실패를 인지
+        """
+
+        for header, offset, count in self.iter_parts():
+            if header:
+                await send(
+                    {"type": "http.response.body", "body": header, "more_body": True}
+                )
+            if count <= 0:
+                continue
+
+            try:
+                async for chunk in self.storage.get_range(
+                    self.key, offset, offset + count - 1
+                ):
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+            except Exception as e:
+                print("[ERROR] 영상 전송 중단:", self.key, e)
+                return
+
+        await send(
+            {"type": "http.response.body", "body": self.closing, "more_body": False}
+        )
@@ -1,4 +1,16 @@
-from fastapi import APIRouter, Depends, Form, UploadFile, File, Path, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Form,
+    Header,
+    UploadFile,
+    File,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_db
@@ -9,13 +21,47 @@ from src.user.models import User
 from src.user.exceptions import AddPointException
 from src.video import exceptions as video_exceptions
 from src.video import service as video_svc
-from src.video.scehmas import VideoRead
+from src.video.scehmas import (
+    VideoPage,
+    VideoRead,
+    UploadSessionCreate,
+    UploadSessionRead,
+)
 from src.video.utils import save_temp_file
 
 router = APIRouter(prefix="/video", tags=["video"])
 admin_router = APIRouter(prefix="/admin/video", tags=["admin"])
 
 
+@admin_router.get(
+    "",
+    response_model=VideoPage,
+    summary="영상 목록 조회 by 어드민",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": video_exceptions.InvalidCursorException().detail,
+        },
+    },
+)
+async def read_videos_by_admin(
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    is_deleted: bool = Query(False, description="삭제된 영상 목록 조회"),
+    admin: User = Depends(admin_required),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    어드민 기업의 영상 목록 (최신순)
+    - 어드민 토큰 필수
+    - is_deleted=true 이면 삭제된(복구 가능한) 영상 목록
+    - 다음 페이지는 응답의 next_cursor를 cursor로 전달
+    """
+    return await video_svc.get_video_page(
+        db=db, user=admin, limit=limit, cursor=cursor, is_deleted=is_deleted
+    )
+
+
 @admin_router.post("/new", status_code=status.HTTP_202_ACCEPTED, summary="영상 업로드")
 async def upload_video_by_admin(
     title=Form(min_length=2, max_length=250, description="영상 제목"),
@@ -28,12 +74,13 @@ async def upload_video_by_admin(
      - request content type: form-data
     - 어드민 토큰 필수
     """
-    tmp_path = await save_temp_file(video_file)
+    tmp_file = await save_temp_file(video_file)
 
     data = {
         "title": title,
         "description": description or title,
-        "tmp_path": tmp_path,
+        "tmp_path": tmp_file.path,
+        "content_hash": tmp_file.sha256,
         "user_id": admin.id,
         "organization_id": admin.organization_id,
     }
@@ -42,6 +89,130 @@ async def upload_video_by_admin(
     return {"message": "업로드 요청이 접수 되었습니다."}
 
 
+@admin_router.post(
+    "/uploads",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UploadSessionRead,
+    summary="이어 올리기 업로드 세션 생성",
+)
+async def create_upload_session(
+    data: UploadSessionCreate,
+    admin: User = Depends(admin_required),
+):
+    """
+    대용량 영상 이어 올리기(resumable upload) 세션 생성 by 어드민
+    - 어드민 토큰 필수
+    - 생성 후 PATCH로 chunk 업로드, 완료 후 complete 요청
+    """
+    return await video_svc.create_upload_session(data=data, admin=admin)
+
+
+@admin_router.get(
+    "/uploads/{upload_id}",
+    response_model=UploadSessionRead,
+    summary="업로드 진행 상태 조회",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadSessionNotFoundException().detail,
+        },
+    },
+)
+async def read_upload_session(
+    response: Response,
+    upload_id: str = Path(..., description="업로드 세션 ID"),
+    admin: User = Depends(admin_required),
+):
+    """
+    업로드 세션의 현재 offset 조회
+    - 연결이 끊긴 경우 offset부터 이어서 업로드
+    """
+    session = await video_svc.get_upload_session(upload_id=upload_id, admin=admin)
+
+    response.headers["Upload-Offset"] = str(session["offset"])
+    response.headers["Upload-Length"] = str(session["upload_length"])
+    response.headers["Cache-Control"] = "no-store"
+
+    return UploadSessionRead(upload_id=upload_id, **session)
+
+
+@admin_router.patch(
+    "/uploads/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    summary="업로드 chunk 전송",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadSessionNotFoundException().detail,
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadOffsetMismatchException().detail,
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadLengthExceededException().detail,
+        },
+    },
+)
+async def upload_chunk(
+    request: Request,
+    upload_id: str = Path(..., description="업로드 세션 ID"),
+    upload_offset: int = Header(
+        ..., alias="Upload-Offset", ge=0, description="chunk 시작 위치"
+    ),
+    admin: User = Depends(admin_required),
+):
+    """
+    업로드 chunk 전송
+    - request body: chunk 바이트 (application/offset+octet-stream)
+    - Upload-Offset 헤더는 현재 세션 offset과 일치해야 함
+    - 응답 Upload-Offset 헤더로 저장 후 offset 반환
+    """
+    new_offset = await video_svc.append_upload_chunk(
+        upload_id=upload_id,
+        admin=admin,
+        offset=upload_offset,
+        stream=request.stream(),
+    )
+
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={"Upload-Offset": str(new_offset)},
+    )
+
+
+@admin_router.post(
+    "/uploads/{upload_id}/complete",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="이어 올리기 업로드 완료",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadSessionNotFoundException().detail,
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorResponse,
+            "description": video_exceptions.UploadIncompleteException().detail,
+        },
+    },
+)
+async def complete_upload(
+    upload_id: str = Path(..., description="업로드 세션 ID"),
+    admin: User = Depends(admin_required),
+):
+    """
+    업로드 완료 후 영상 등록 요청
+    - 전체 크기만큼 업로드된 경우에만 가능
+    - 영상 등록은 celery를 통해 비동기 처리
+    """
+    data = await video_svc.complete_upload_session(upload_id=upload_id, admin=admin)
+    task_video.process_video_upload.delay(data)
+
+    return {"message": "업로드 요청이 접수 되었습니다."}
+
+
 @admin_router.put(
     "/{video_id}",
     status_code=status.HTTP_202_ACCEPTED,
@@ -67,13 +238,14 @@ async def update_video_by_admin(
 
     # 2. 파일이 포함된 경우 -> 비동기 처리
     if video_file and video_file.filename.strip():
-        tmp_path = await save_temp_file(video_file)
+        tmp_file = await save_temp_file(video_file)
 
         task_data = {
             "video_id": video_id,
             "title": title,
             "description": description,
-            "tmp_path": tmp_path,
+            "tmp_path": tmp_file.path,
+            "content_hash": tmp_file.sha256,
             "organization_id": admin.organization_id,
         }
         task_video.process_video_update.delay(task_data)
@@ -133,6 +305,55 @@ async def restore_video(
     return VideoRead.model_validate(video)
 
 
+@router.get(
+    "",
+    response_model=VideoPage,
+    summary="영상 목록 조회",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": video_exceptions.InvalidCursorException().detail,
+        },
+    },
+)
+async def read_videos(
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    로그인 유저 기업의 영상 목록 (최신순)
+    - 토큰 필수
+    - 다음 페이지는 응답의 next_cursor를 cursor로 전달
+    """
+    return await video_svc.get_video_page(
+        db=db, user=current_user, limit=limit, cursor=cursor
+    )
+
+
+@router.get(
+    "/search",
+    response_model=list[VideoRead],
+    summary="영상 검색",
+)
+async def search_videos(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(20, ge=1, le=50, description="조회 개수"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    로그인 유저 기업의 영상 제목/설명 검색 (관련도순)
+    - 토큰 필수
+    - 검색어의 모든 단어를 포함하는 영상, 단어는 접두어로 일치 (예: "캠" -> "캠프")
+    - 제목 일치가 설명 일치보다 우선
+    """
+    return await video_svc.search_videos(
+        db=db, user=current_user, keyword=q, limit=limit
+    )
+
+
 @router.get(
     "/{video_id}",
     summary="영상 조회",
@@ -141,6 +362,10 @@ async def restore_video(
             "model": ErrorResponse,
             "description": video_exceptions.VideoNotFoundException().detail,
         },
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {
+            "model": ErrorResponse,
+            "description": video_exceptions.VideoRangeNotSatisfiableException().detail,
+        },
         status.HTTP_429_TOO_MANY_REQUESTS: {
             "model": ErrorResponse,
             "description": AddPointException().detail,
@@ -149,15 +374,69 @@ async def restore_video(
 )
 async def read_video(
     video_id: int,
+    range_header: str | None = Header(None, alias="Range", description="byte 범위"),
+    if_none_match: str | None = Header(None, description="캐시된 영상 ETag"),
+    if_modified_since: str | None = Header(None, description="캐시된 영상 수정일"),
+    if_range: str | None = Header(None, description="Range 적용 조건"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
     영상 조회
     - 토큰 필수
-    - 영상 조회 시 포인트 적립
+    - 영상 조회 시 포인트 적립 (처음부터 재생하는 요청만 적립)
+    - Range 헤더 지원 (206 Partial Content, multipart/byteranges)
+    - ETag / Last-Modified 조건부 요청 지원 (304 Not Modified)
     """
 
     return await video_svc.get_video_stream_with_point(
-        db=db, video_id=video_id, user=current_user
+        db=db,
+        video_id=video_id,
+        user=current_user,
+        range_header=range_header,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+        if_range=if_range,
+    )
+
+
+@router.get(
+    "/{video_id}/hls/{file_path:path}",
+    summary="영상 HLS 조회",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": video_exceptions.VideoNotFoundException().detail,
+        },
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorResponse,
+            "description": video_exceptions.VideoNotReadyException().detail,
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "model": ErrorResponse,
+            "description": AddPointException().detail,
+        },
+    },
+)
+async def read_video_hls(
+    video_id: int,
+    file_path: str = Path(..., description="master 플레이리스트 기준 상대 경로"),
+    range_header: str | None = Header(None, alias="Range", description="byte 범위"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    영상 HLS 스트리밍
+    - 토큰 필수
+    - `/video/{video_id}/hls/master.m3u8`로 재생 시작 (포인트 적립)
+    - 화질별 플레이리스트 / 세그먼트 경로는 master 플레이리스트에 기록된 경로
+      (파일 해시 포함, 영상 파일 교체 시 변경)
+    """
+
+    return await video_svc.get_hls_file_with_point(
+        db=db,
+        video_id=video_id,
+        user=current_user,
+        file_path=file_path,
+        range_header=range_header,
     )
@@ -20,3 +20,39 @@ class VideoRead(BaseModel):
     @field_serializer("created_at")
     def serialize_datetime(self, value: datetime, _info):
         return value.strftime("%Y-%m-%d %H:%M")
+
+
+class VideoPage(BaseModel):
+    items: Annotated[list[VideoRead], Field(description="영상 목록")]
+    next_cursor: Annotated[
+        Optional[str],
+        Field(None, description="다음 페이지 cursor, 마지막 페이지면 null"),
+    ]
+
+
+class UploadSessionCreate(BaseModel):
+    title: Annotated[
+        str,
+        Field(min_length=2, max_length=250, description="영상 제목", example="Video_1"),
+    ]
+    description: Annotated[
+        Optional[str], Field(None, min_length=2, description="영상 설명")
+    ]
+    filename: Annotated[str, Field(description="원본 파일명", example="video.mp4")]
+    upload_length: Annotated[
+        int, Field(gt=0, description="전체 파일 크기(byte)", example=1048576)
+    ]
+
+
+class UploadSessionRead(BaseModel):
+    upload_id: Annotated[str, Field(description="업로드 세션 ID")]
+    offset: Annotated[int, Field(description="현재까지 업로드된 크기(byte)")]
+    upload_length: Annotated[int, Field(description="전체 파일 크기(byte)")]
+
+
+class TempFileInfo(BaseModel):
+    """임시 저장 파일 정보"""
+
+    path: str
+    size: int
+    sha256: str
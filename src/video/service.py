@@ -1,13 +1,110 @@
-from fastapi.responses import StreamingResponse
+import asyncio
+import posixpath
+import re
+import uuid
+from typing import AsyncIterator
+
+from fastapi import Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import MAX_UPLOAD_SIZE, UPLOAD_CHUNK_CONCURRENCY
+
 from src.user.models import User
-from src.user.service import add_user_video_point_with_lock
+from src.user.service import add_user_video_point
 from src.video import repository as video_repo
 from src.video import exceptions as video_exceptions
-from src.video.utils import stream_video
+from src.video import uploads as upload_session
+from src.video.processing import HLS_CONTENT_TYPES
+from src.video.responses import VideoFileResponse
+from src.video.scehmas import (
+    UploadSessionCreate,
+    UploadSessionRead,
+    VideoPage,
+    VideoRead,
+)
+from src.video.utils import (
+    decode_cursor,
+    encode_cursor,
+    format_http_date,
+    get_last_modified,
+    get_video_file_stat,
+    is_if_range_matched,
+    is_not_modified,
+    make_temp_path,
+    make_video_etag,
+    parse_range_header,
+    write_temp_file_chunk,
+)
 from src.video.models import Video
 
+VIDEO_MEDIA_TYPE = "video/mp4"
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+SEARCH_MAX_TERMS = 8
+HLS_MASTER_PLAYLIST_NAME = "master.m3u8"  # 화질 목록과 관계없는 재생 시작 경로
+HLS_FILE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]*$")
+# 세그먼트 주소에 파일 해시가 포함되어 같은 주소의 내용은 바뀌지 않음
+HLS_SEGMENT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+# 워커 당 동시에 처리하는 업로드 chunk 수 제한
+upload_chunk_semaphore = asyncio.Semaphore(UPLOAD_CHUNK_CONCURRENCY)
+
+
+async def get_video_page(
+    db: AsyncSession,
+    user: User,
+    limit: int,
+    cursor: str | None = None,
+    is_deleted: bool = False,
+) -> VideoPage:
+    """유저 기업의 영상 목록 한 페이지 + 다음 페이지 cursor"""
+
+    rows = await video_repo.get_videos_page(
+        db,
+        org_id=user.organization_id,
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+        is_deleted=is_deleted,
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return VideoPage(
+        items=[VideoRead.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+def make_search_query(keyword: str) -> str | None:
+    """
+    검색어 -> tsquery 문자열 (단어마다 접두어 검색, 모든 단어 포함)
+    - 예: "여름 캠프 브이" -> "여름:* & 캠프:* & 브이:*"
+    - 문자/숫자 외의 tsquery 연산자는 제거
+    """
+
+    terms = SEARCH_TERM_PATTERN.findall(keyword.lower())[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+async def search_videos(
+    db: AsyncSession, user: User, keyword: str, limit: int
+) -> list[VideoRead]:
+    """유저 기업의 영상 제목/설명 검색"""
+
+    ts_query = make_search_query(keyword)
+    if ts_query is None:
+        return []
+
+    rows = await video_repo.search_videos(
+        db, org_id=user.organization_id, ts_query=ts_query, limit=limit
+    )
+    return [VideoRead.model_validate(row) for row in rows]
+
 
 async def can_modify_video(db: AsyncSession, video_id: int, admin: User) -> Video:
     """영상 수정 가능 여부 확인"""
@@ -64,18 +161,239 @@ async def get_video_stream_with_point(
     db: AsyncSession,
     video_id: int,
     user: User,
-) -> StreamingResponse:
-    """일반 유저 비디오 조회 + 포인트 적립 + 스트리밍 응답 생성"""
+    range_header: str | None = None,
+    if_none_match: str | None = None,
+    if_modified_since: str | None = None,
+    if_range: str | None = None,
+) -> Response:
+    """
+    일반 유저 비디오 조회 + 포인트 적립 + 스트리밍 응답 생성
+
+    - Range 헤더가 있으면 요청 범위만 206 Partial Content로 응답
+    - ETag / Last-Modified 검증 통과 시 304 Not Modified (본문 없음)
+    - 포인트는 영상 처음(0 바이트)부터 요청한 경우에만 적립 (탐색 요청 제외)
+      304 응답도 캐시된 영상 재생이므로 동일 기준으로 적립
+    """
 
     video: Video = await video_repo.get_video_by_id(db, video_id)
 
     if not video or not video.path:
         raise video_exceptions.VideoNotFoundException
 
+    file_stat = await run_in_threadpool(get_video_file_stat, video.path)
+    etag = make_video_etag(video.path, file_stat, video.updated_at)
+    last_modified = get_last_modified(file_stat, video.updated_at)
+    validator_headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(last_modified),
+        "Cache-Control": "no-cache",  # 재사용 전 항상 재검증 -> 포인트 적립 보장
+    }
+
+    if is_not_modified(etag, last_modified, if_none_match, if_modified_since):
+        if is_playback_start(range_header, file_stat.size):
+            await add_user_video_point(db=db, user_id=user.id, video_id=video.id)
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers
+        )
+
+    if range_header and if_range:
+        if not is_if_range_matched(if_range, etag, last_modified):
+            range_header = None
+
+    file_size = file_stat.size
+    ranges = parse_range_header(range_header, file_size) if range_header else []
+
     # 포인트 적립
-    await add_user_video_point_with_lock(db=db, user_id=user.id, video_id=video.id)
+    if not ranges or ranges[0][0] == 0:
+        await add_user_video_point(db=db, user_id=user.id, video_id=video.id)
 
     # 스트리밍 생성
-    video_stream = stream_video(video.path)
+    return VideoFileResponse(
+        video.path,
+        file_size,
+        ranges,
+        headers=validator_headers,
+        media_type=VIDEO_MEDIA_TYPE,
+    )
+
+
+async def get_hls_file_with_point(
+    db: AsyncSession,
+    video_id: int,
+    user: User,
+    file_path: str,
+    range_header: str | None = None,
+) -> Response:
+    """
+    HLS 플레이리스트 / 세그먼트 응답
+
+    - master 플레이리스트 요청 시 포인트 적립 (재생 시작)
+    - 화질별 플레이리스트 / 세그먼트는 파일 해시로 시작하는 경로
+      (예: <hash>/720p/seg_00000.m4s), 영상 파일이 교체되면 이전 해시 경로는 404
+    - 세그먼트는 장기 캐시 허용, Range 요청 지원
+    """
+
+    video: Video = await video_repo.get_video_by_id(db, video_id)
+    if not video:
+        raise video_exceptions.VideoNotFoundException
+    if not video.hls_playlist:
+        raise video_exceptions.VideoNotReadyException
+
+    # master 플레이리스트 하위 파일만 허용 (경로 조작 방지)
+    parts = file_path.split("/")
+    media_type = HLS_CONTENT_TYPES.get(posixpath.splitext(file_path)[1])
+    if (
+        len(parts) > 3
+        or not all(HLS_FILE_NAME_PATTERN.match(part) for part in parts)
+        or media_type is None
+    ):
+        raise video_exceptions.VideoNotFoundException
+
+    hls_dir = posixpath.dirname(video.hls_playlist)
+    if file_path == HLS_MASTER_PLAYLIST_NAME:
+        key = video.hls_playlist
+    else:
+        content_hash, _, relative_path = file_path.partition("/")
+        if content_hash != posixpath.basename(hls_dir) or not relative_path:
+            raise video_exceptions.VideoNotFoundException
+        key = posixpath.join(hls_dir, relative_path)
+    file_stat = await run_in_threadpool(get_video_file_stat, key)
+    ranges = parse_range_header(range_header, file_stat.size) if range_header else []
+
+    if media_type != HLS_CONTENT_TYPES[".m3u8"]:
+        cache_control = HLS_SEGMENT_CACHE_CONTROL
+    else:
+        cache_control = "no-cache"
+        if key == video.hls_playlist and (not ranges or ranges[0][0] == 0):
+            await add_user_video_point(db=db, user_id=user.id, video_id=video.id)
+
+    return VideoFileResponse(
+        key,
+        file_stat.size,
+        ranges,
+        headers={"Cache-Control": cache_control},
+        media_type=media_type,
+    )
+
+
+def is_playback_start(range_header: str | None, file_size: int) -> bool:
+    """처음(0 바이트)부터 재생하는 요청인지 여부 - 포인트 적립 기준"""
+
+    if not range_header:
+        return True
+
+    try:
+        ranges = parse_range_header(range_header, file_size)
+    except video_exceptions.VideoRangeNotSatisfiableException:
+        return False
+
+    return not ranges or ranges[0][0] == 0
+
+
+async def create_upload_session(
+    data: UploadSessionCreate, admin: User
+) -> UploadSessionRead:
+    """이어 올리기 업로드 세션 생성 - 빈 임시 파일 생성 후 세션 저장"""
+
+    if data.upload_length > MAX_UPLOAD_SIZE:
+        raise video_exceptions.UploadLengthExceededException
+
+    upload_id = uuid.uuid4().hex
+    tmp_path = make_temp_path(data.filename)
+    open(tmp_path, "wb").close()
+
+    await upload_session.save_upload_session(
+        upload_id,
+        {
+            "user_id": admin.id,
+            "organization_id": admin.organization_id,
+            "title": data.title,
+            "description": data.description,
+            "tmp_path": tmp_path,
+            "upload_length": data.upload_length,
+            "offset": 0,
+        },
+    )
+
+    return UploadSessionRead(
+        upload_id=upload_id, offset=0, upload_length=data.upload_length
+    )
+
+
+async def get_upload_session(upload_id: str, admin: User) -> dict:
+    """업로드 세션 조회 - 세션을 생성한 어드민만 접근 가능"""
+
+    session = await upload_session.get_upload_session(upload_id)
+    if session is None:
+        raise video_exceptions.UploadSessionNotFoundException
+
+    if session["user_id"] != admin.id:
+        raise video_exceptions.UnauthorizedAccessException
+
+    return session
+
+
+async def append_upload_chunk(
+    upload_id: str, admin: User, offset: int, stream: AsyncIterator[bytes]
+) -> int:
+    """
+    업로드 chunk 저장
+
+    :param offset int: 클라이언트가 보낸 Upload-Offset, 현재 세션 offset과 같아야 함
+    :return int: 저장 후 offset
+    """
+
+    session = await get_upload_session(upload_id, admin)
+
+    lock_token = await upload_session.acquire_upload_lock(upload_id)
+    if lock_token is None:
+        raise video_exceptions.UploadInProgressException
+
+    try:
+        # 락 획득 전 다른 요청이 offset을 변경했을 수 있으므로 다시 조회
+        session = await get_upload_session(upload_id, admin)
+        if offset != session["offset"]:
+            raise video_exceptions.UploadOffsetMismatchException(session["offset"])
+
+        async with upload_chunk_semaphore:
+            written, exceeded = await write_temp_file_chunk(
+                session["tmp_path"],
+                offset,
+                stream,
+                max_length=session["upload_length"] - offset,
+            )
+
+        new_offset = offset + written
+        await upload_session.update_upload_offset(upload_id, new_offset)
+
+        if exceeded:
+            raise video_exceptions.UploadLengthExceededException
+
+        return new_offset
+
+    finally:
+        await upload_session.release_upload_lock(upload_id, lock_token)
+
+
+async def complete_upload_session(upload_id: str, admin: User) -> dict:
+    """
+    업로드 완료 처리 - 세션 삭제 후 영상 등록 작업 데이터 반환
+
+    :return dict: process_video_upload 작업 데이터
+    """
+
+    session = await get_upload_session(upload_id, admin)
+
+    if session["offset"] != session["upload_length"]:
+        raise video_exceptions.UploadIncompleteException
+
+    if not await upload_session.delete_upload_session(upload_id):
+        raise video_exceptions.UploadSessionNotFoundException
 
-    return StreamingResponse(video_stream, media_type="video/mp4")
+    return {
+        "title": session["title"],
+        "description": session["description"] or session["title"],
+        "tmp_path": session["tmp_path"],
+        "user_id": session["user_id"],
+        "organization_id": session["organization_id"],
+    }
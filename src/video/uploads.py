@@ -0,0 +1,69 @@
+from src.core.config import (
+    REDIS_CLIENT,
+    UPLOAD_SESSION_TTL,
+    UPLOAD_CHUNK_LOCK_TIMEOUT,
+)
+from src.core.locks import acquire_lock, release_lock
+
+SESSION_KEY = "upload:{upload_id}"
+LOCK_KEY = "upload:{upload_id}:lock"
+INT_FIELDS = ("user_id", "organization_id", "upload_length", "offset")
+
+
+async def save_upload_session(upload_id: str, session: dict) -> None:
+    """업로드 세션 저장 (Redis hash, TTL 갱신)"""
+
+    key = SESSION_KEY.format(upload_id=upload_id)
+    mapping = {field: value for field, value in session.items() if value is not None}
+
+    async with REDIS_CLIENT.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, UPLOAD_SESSION_TTL)
+        await pipe.execute()
+
+
+async def get_upload_session(upload_id: str) -> dict | None:
+    session = await REDIS_CLIENT.hgetall(SESSION_KEY.format(upload_id=upload_id))
+    if not session:
+        return None
+
+    for field in INT_FIELDS:
+        session[field] = int(session[field])
+    session.setdefault("description", None)
+
+    return session
+
+
+async def update_upload_offset(upload_id: str, offset: int) -> None:
+    key = SESSION_KEY.format(upload_id=upload_id)
+
+    async with REDIS_CLIENT.pipeline(transaction=True) as pipe:
+        pipe.hset(key, "offset", offset)
+        pipe.expire(key, UPLOAD_SESSION_TTL)
+        await pipe.execute()
+
+
+async def delete_upload_session(upload_id: str) -> bool:
+    """세션 삭제, 이미 삭제된 경우 False (중복 완료 요청 방지)"""
+    deleted = await REDIS_CLIENT.delete(SESSION_KEY.format(upload_id=upload_id))
+    return deleted > 0
+
+
+async def acquire_upload_lock(upload_id: str) -> str | None:
+    """
+    같은 세션에 대한 동시 chunk 요청 방지
+
+    :return str | None: 락 해제용 token, 다른 요청이 업로드 중이면 None
+    """
+    return await acquire_lock(
+        LOCK_KEY.format(upload_id=upload_id), UPLOAD_CHUNK_LOCK_TIMEOUT
+    )
+
+
+async def release_upload_lock(upload_id: str, token: str) -> None:
+    """
+    자신이 획득한 락만 해제
+    - UPLOAD_CHUNK_LOCK_TIMEOUT보다 오래 걸린 요청이 다른 요청의 락을 지우지 않도록 token 비교
+    """
+    if not await release_lock(LOCK_KEY.format(upload_id=upload_id), token):
+        print("[ERROR] 업로드 락이 만료된 후 해제 시도:", upload_id)
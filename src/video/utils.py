@@ -1,58 +1,330 @@
 import aiofiles as aio
+import base64
+import hashlib
 import os
-import shutil
-import time
 import uuid
 
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from fastapi import UploadFile
-from typing import AsyncGenerator
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from typing import AsyncIterator, BinaryIO
 
-from src.core.config import TEMP_UPLOAD_DIR, UPLOAD_DIR, CHUNK_SIZE
+from src.core.config import (
+    TEMP_UPLOAD_DIR,
+    UPLOAD_BUFFER_SIZE,
+    MAX_UPLOAD_SIZE,
+)
+from src.core.storage import StorageStat, get_storage
 from src.video import exceptions as video_exceptions
+from src.video.scehmas import TempFileInfo
 
+MAX_RANGE_COUNT = 16  # multi-range 요청 허용 개수
 
-async def save_temp_file(file: UploadFile) -> str:
-    """임시 저장"""
+
+def make_temp_path(filename: str) -> str:
+    """임시 저장 경로 생성"""
     if not os.path.exists(TEMP_UPLOAD_DIR):
         os.makedirs(TEMP_UPLOAD_DIR)
 
-    ext = os.path.splitext(file.filename)[1]
+    ext = os.path.splitext(filename)[1]
     tmp_filename = f"{uuid.uuid4().hex}_{ext}"
-    tmp_path = os.path.join(TEMP_UPLOAD_DIR, tmp_filename)
+    return os.path.join(TEMP_UPLOAD_DIR, tmp_filename)
+
+
+def write_and_hash(out_file: BinaryIO, hasher, chunk: bytes) -> None:
+    """파일 쓰기와 해시 계산을 한 번의 스레드 작업으로 처리"""
+    out_file.write(chunk)
+    hasher.update(chunk)
 
-    async with aio.open(tmp_path, "wb") as out_file:
-        while chunk := await file.read(1024):
-            await out_file.write(chunk)
 
-    return tmp_path
+async def save_temp_file(file: UploadFile) -> TempFileInfo:
+    """
+    임시 저장 - UPLOAD_BUFFER_SIZE 단위로 저장하면서 SHA-256, 크기 계산
 
+    :return TempFileInfo: 임시 파일 경로, 크기, SHA-256
+    :raise UploadLengthExceededException: MAX_UPLOAD_SIZE 초과
+    """
+    tmp_path = make_temp_path(file.filename)
+    hasher = hashlib.sha256()
+    size = 0
 
-def upload_video_file(tmp_path: str, organization_id: int) -> str:
-    """영상 파일 업로드"""
     try:
-        filename = os.path.basename(tmp_path)
-        org_dir = os.path.join(UPLOAD_DIR, f"{organization_id}")
-        if not os.path.exists(org_dir):
-            os.makedirs(org_dir)
+        out_file = await run_in_threadpool(open, tmp_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_BUFFER_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise video_exceptions.UploadLengthExceededException
+
+                await run_in_threadpool(write_and_hash, out_file, hasher, chunk)
+        finally:
+            await run_in_threadpool(out_file.close)
+
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return TempFileInfo(path=tmp_path, size=size, sha256=hasher.hexdigest())
+
+
+async def write_temp_file_chunk(
+    tmp_path: str, offset: int, stream: AsyncIterator[bytes], max_length: int
+) -> tuple[int, bool]:
+    """
+    임시 파일의 offset 위치부터 chunk 저장 (resumable upload)
+
+    :param max_length int: 이번 요청에서 저장 가능한 최대 크기
+    :return tuple[int, bool]: (저장한 바이트 수, 최대 크기 초과 여부)
+        - 연결이 끊겨도 저장된 만큼은 반환하여 이어서 업로드 가능
+    """
+
+    written = 0
+    exceeded = False
+
+    async with aio.open(tmp_path, "r+b") as out_file:
+        await out_file.seek(offset)
+        try:
+            async for chunk in stream:
+                if written + len(chunk) > max_length:
+                    exceeded = True
+                    chunk = chunk[: max_length - written]
+
+                await out_file.write(chunk)
+                written += len(chunk)
+
+                if exceeded:
+                    break
+
+        except ClientDisconnect:
+            print("[ERROR] 업로드 연결 끊김, 저장된 크기:", written)
+
+    return written, exceeded
+
+
+def get_blob_key(content_hash: str) -> str:
+    """SHA-256 기준 저장소 key (blobs/ab/cd/abcd...)"""
+    return f"blobs/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+def hash_file(file_path: str) -> str:
+    """파일 SHA-256 계산 (이어 올리기 업로드 등 해시가 없는 경우)"""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(UPLOAD_BUFFER_SIZE):
+            hasher.update(chunk)
 
-        dest_path = os.path.join(org_dir, f"{int(time.time())}_{filename}")
-        shutil.move(tmp_path, dest_path)
+    return hasher.hexdigest()
 
-        return dest_path
+
+def store_blob(tmp_path: str, blob_key: str) -> bool:
+    """
+    임시 파일을 저장소 blob으로 이동
+    - 같은 내용의 blob이 이미 있으면 이동하지 않음 (임시 파일은 호출한 쪽에서 정리)
+
+    :return bool: 새로 저장했으면 True
+    """
+    storage = get_storage()
+    try:
+        if storage.exists(blob_key):
+            return False
+
+        storage.move_file(blob_key, tmp_path)
+        return True
 
     except Exception as e:
         print("[ERROR]", e)
         raise video_exceptions.VideoUploadException
 
 
-async def stream_video(video_path: str) -> AsyncGenerator[bytes, None]:
-    """비디오 파일을 스트리밍으로 읽어오는 Generator"""
-
+def get_video_file_stat(video_key: str) -> StorageStat:
+    """저장소의 영상 정보(크기, 수정 시각) 조회"""
     try:
-        async with aio.open(video_path, "rb") as video_file:
-            while chunk := await video_file.read(CHUNK_SIZE):
-                yield chunk
-
+        file_stat = get_storage().stat(video_key)
     except Exception as e:
         print("[ERROR]", e)
-        raise video_exceptions.VideoStreamingException
+        raise video_exceptions.VideoNotFoundException
+
+    if file_stat is None:
+        raise video_exceptions.VideoNotFoundException
+    return file_stat
+
+
+def make_video_etag(
+    video_key: str, file_stat: StorageStat, updated_at: datetime
+) -> str:
+    """저장소 key, 파일 크기/수정 시각, 영상 수정일 기반 strong ETag 생성"""
+
+    raw = (
+        f"{video_key}:{file_stat.size}:{file_stat.modified_at.isoformat()}:{updated_at}"
+    )
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def get_last_modified(file_stat: StorageStat, updated_at: datetime) -> datetime:
+    """파일 수정 시각과 영상 수정일 중 최신 시각 (UTC, 초 단위)"""
+
+    file_modified = file_stat.modified_at.astimezone(timezone.utc)
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+    return max(file_modified, updated_at).replace(microsecond=0)
+
+
+def format_http_date(value: datetime) -> str:
+    return format_datetime(value, usegmt=True)
+
+
+def parse_http_date(value: str) -> datetime | None:
+    """HTTP 날짜 파싱, 형식이 잘못된 경우 None"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_etags(header: str) -> list[str]:
+    """If-None-Match 등의 ETag 목록 파싱"""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: datetime,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    """
+    304 Not Modified 응답 여부 (RFC 9110 13.2.2)
+    - If-None-Match가 있으면 weak 비교로만 판단하고 If-Modified-Since 무시
+    """
+
+    if if_none_match:
+        tags = parse_etags(if_none_match)
+        return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+    if if_modified_since:
+        since = parse_http_date(if_modified_since)
+        return since is not None and last_modified <= since
+
+    return False
+
+
+def is_if_range_matched(if_range: str, etag: str, last_modified: datetime) -> bool:
+    """If-Range 검증 - 불일치 시 Range를 무시하고 전체 응답"""
+
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        # strong 비교만 허용
+        return if_range == etag
+
+    since = parse_http_date(if_range)
+    return since is not None and since == last_modified
+
+
+def parse_range_header(range_header: str, file_size: int) -> list[tuple[int, int]]:
+    """
+    Range 헤더 파싱 (RFC 9110)
+
+    :param range_header str: 요청 Range 헤더 (ex. bytes=0-499, 1000-)
+    :param file_size int: 영상 파일 크기
+    :return list[tuple[int, int]]: (start, end) 목록, end 포함
+        - 형식이 잘못된 헤더는 무시하고 빈 목록 반환 (전체 응답)
+    :raise VideoRangeNotSatisfiableException: 만족 가능한 범위가 없는 경우
+    """
+
+    unit, _, range_set = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not range_set.strip():
+        return []
+
+    ranges = []
+    for spec in range_set.split(","):
+        start_str, sep, end_str = spec.strip().partition("-")
+        start_str, end_str = start_str.strip(), end_str.strip()
+
+        if not sep or not (start_str or end_str):
+            return []
+        if not all(value.isdigit() for value in (start_str, end_str) if value):
+            return []
+
+        if not start_str:
+            # suffix range: 마지막 N 바이트
+            suffix_length = int(end_str)
+            if suffix_length == 0 or file_size == 0:
+                continue
+            ranges.append((max(file_size - suffix_length, 0), file_size - 1))
+            continue
+
+        start = int(start_str)
+        end = int(end_str) if end_str else file_size - 1
+        if end_str and end < start:
+            return []
+        if start >= file_size:
+            continue
+        ranges.append((start, min(end, file_size - 1)))
+
+    if not ranges:
+        raise video_exceptions.VideoRangeNotSatisfiableException(file_size)
+
+    ranges = merge_ranges(ranges)
+    if len(ranges) > MAX_RANGE_COUNT:
+        return []
+
+    return ranges
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """겹치거나 인접한 범위 병합"""
+
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def make_content_range(start: int, end: int, file_size: int) -> str:
+    return f"bytes {start}-{end}/{file_size}"
+
+
+def make_multipart_headers(
+    ranges: list[tuple[int, int]], file_size: int, boundary: str, media_type: str
+) -> tuple[list[bytes], bytes]:
+    """multipart/byteranges 각 파트 헤더와 종료 boundary 생성"""
+
+    part_headers = [
+        (
+            f"\r\n--{boundary}\r\n"
+            f"Content-Type: {media_type}\r\n"
+            f"Content-Range: {make_content_range(start, end, file_size)}\r\n\r\n"
+        ).encode()
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode()
+
+    return part_headers, closing
+
+
+def encode_cursor(created_at: datetime, video_id: int) -> str:
+    """목록 조회 cursor - 마지막 영상의 (created_at, id)"""
+    value = f"{created_at.isoformat()}|{video_id}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """cursor -> (created_at, id), 형식이 잘못된 경우 InvalidCursorException"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, video_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(video_id)
+    except ValueError:
+        raise video_exceptions.InvalidCursorException